@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+기사 JSON 스트리밍 변환 (csv2json.py, 날짜 수정.py에서 사용)
+
+- CSV를 chunksize 행씩 읽어 기사 dict로 바꾸면서 바로 파일에 씀 -> 파일 크기와 상관없이 메모리 일정
+- 카테고리 소문자/허용값 정리, 날짜 ISO 8601 정리(fix_date_format)를 변환하면서 함께 처리
+- 출력 형식
+    json   : 기존과 같은 {"articles": [...]} 구조, 들여쓰기 없이 한 줄로 (서버 bulk API에 그대로 전송 가능)
+    ndjson : 한 줄에 기사 하나 (이어 붙이기/나눠 읽기가 쉬움)
+- 임시 파일에 쓰다가 정상 종료했을 때만 원래 이름으로 교체 (중간에 오류가 나면 잘린 파일이 남지 않음)
+- orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 인코딩 (결과 내용은 같음)
+"""
+
+import json
+import os
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CATEGORY_CODES = {'politics', 'economy', 'tech', 'others'}
+OUTPUT_FORMATS = ['json', 'ndjson']
+
+
+def fix_date_format(date_str):
+    """날짜 문자열 -> ISO 8601 (시간대 없으면 +09:00, 비어 있으면 현재 시각)"""
+    if not date_str:
+        return datetime.now().astimezone().isoformat()
+
+    # 1. RFC 1123 형식 처리 (예: Fri, 19 Dec 2025 16:50:00 +0900)
+    if ',' in date_str:
+        try:
+            dt = parsedate_to_datetime(date_str)
+            return dt.isoformat()
+        except:
+            pass
+
+    # 2. 일반 공백 형식 처리 (예: 2025-12-19 16:31:35)
+    if ' ' in date_str and 'T' not in date_str:
+        try:
+            # 공백을 T로 바꾸고 기본 시간대(+09:00)를 붙여줌
+            clean_date = date_str.replace(' ', 'T')
+            if '+' not in clean_date and 'Z' not in clean_date:
+                clean_date += "+09:00"
+            return clean_date
+        except:
+            pass
+
+    # 3. 이미 올바른 형식인 경우 또는 기타
+    return date_str
+
+
+def normalize_category(category):
+    """카테고리 소문자 변환 (Politics -> politics), 허용값이 아니면 others"""
+    category = str(category or '').lower()
+    return category if category in CATEGORY_CODES else 'others'
+
+
+def dumps(obj):
+    """dict -> 공백 없는 UTF-8 JSON 바이트"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ArticleWriter:
+    """
+    with ArticleWriter("뉴스데이터.json", "json") as writer:
+        writer.write(article)
+    metadata: json 형식일 때 "articles" 뒤에 함께 쓸 최상위 키 (예: 입력 파일의 다른 키)
+    with 블록이 예외로 끝나면 임시 파일을 지우고 기존 파일은 그대로 둠
+    """
+
+    def __init__(self, path, output_format='json', metadata=None):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식: {output_format} ({', '.join(OUTPUT_FORMATS)})")
+        self.path = path
+        self.output_format = output_format
+        self.metadata = metadata if metadata is not None else {}
+        self.count = 0
+        self._tmp_path = f"{path}.tmp"
+        self._file = open(self._tmp_path, 'wb', buffering=1 << 20)
+        if output_format == 'json':
+            self._file.write(b'{"articles":[')
+
+    def write(self, article):
+        if self.output_format == 'json':
+            if self.count:
+                self._file.write(b',')
+            self._file.write(dumps(article))
+        else:
+            self._file.write(dumps(article) + b'\n')
+        self.count += 1
+
+    def close(self):
+        """마무리하고 임시 파일을 원래 이름으로 교체"""
+        if self.output_format == 'json':
+            self._file.write(b']')
+            for key, value in self.metadata.items():
+                if key != 'articles':
+                    self._file.write(b',' + dumps(key) + b':' + dumps(value))
+            self._file.write(b'}')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """쓰던 임시 파일 삭제 (기존 출력 파일은 건드리지 않음)"""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_articles(path, metadata=None):
+    """
+    기사 JSON 파일 읽기 -> 기사 dict 제너레이터
+    NDJSON(.ndjson/.jsonl)은 한 줄씩 읽어 메모리 일정, {"articles": [...]} 형식은 파일 전체를 읽음
+    metadata: dict를 넘기면 {"articles": [...]} 형식의 다른 최상위 키를 채움 (ArticleWriter에 넘겨 그대로 보존)
+    """
+    if path.endswith(('.ndjson', '.jsonl')):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line) if orjson is None else orjson.loads(line)
+        return
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    if isinstance(data, dict):
+        if metadata is not None:
+            metadata.update((key, value) for key, value in data.items() if key != 'articles')
+        yield from data.get('articles', [])
+    else:
+        yield from data
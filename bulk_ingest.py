@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+원본 기사 대량 저장 (POST /api/admin/ingestion/articles:bulk)
+
+- 기사 목록을 요청 본문 크기(max_bytes) 기준 조각으로 나눠 gzip 압축 후 여러 연결로 동시에 전송
+- 조각마다 성공/실패를 따로 기록 -> 실패한 조각의 기사만 다시 보내면 됨
+- 일시적인 실패(연결 오류, 408/429/5xx)는 그 조각만 지수 백오프로 재시도
+- 요청 내용 문제(400/413/422)로 실패한 조각은 반으로 나눠 다시 보내 문제 기사만 골라냄
+- 인증/주소 문제(401/403/404/405)는 어느 조각을 보내도 같으므로 바로 전송 중단 (남은 조각은 실패로 기록)
+- 압축한 요청이 4xx로 거부되면 압축 없이 한 번 더 보내고, 그게 성공하면 그 뒤로는 압축 없이 전송
+  (압축한 요청이 한 번이라도 성공했으면 gzip은 되는 것이므로 다시 확인하지 않음)
+- 끝까지 실패한 기사는 입력과 같은 {"articles": [...]} 형식 파일로 저장 -> 그 파일로 다시 실행
+
+사용법:
+    python bulk_ingest.py japanese_news_fixed.json [--url http://localhost:8080/api/admin/ingestion/articles:bulk]
+                          [--chunk-kb 256] [--workers 3] [--no-gzip] [--failed-output 실패.json]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from article_stream import read_articles
+
+DEFAULT_URL = "http://localhost:8080/api/admin/ingestion/articles:bulk"
+
+# 다시 보내면 성공할 수 있는 응답 코드 (연결 오류도 재시도)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+# 조각 안의 특정 기사 때문일 수 있는 응답 코드 (반으로 나눠 다시 보냄)
+SPLITTABLE_STATUS = {400, 413, 422}
+# 어느 조각을 보내도 같은 결과인 응답 코드 (전송 중단)
+FATAL_STATUS = {401, 403, 404, 405}
+
+_BODY_HEAD = b'{"articles":['
+_BODY_TAIL = b']}'
+
+
+def encode_article(article):
+    """기사 하나 -> 공백 없는 JSON 바이트 (들여쓰기 없이 보내 본문 크기를 줄임)"""
+    return json.dumps(article, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def chunk_indices(sizes, max_bytes=256 * 1024, max_articles=500):
+    """
+    기사별 JSON 크기 리스트 -> 조각별 기사 번호 리스트
+    조각 하나의 요청 본문이 max_bytes, 기사 수가 max_articles를 넘지 않게 앞에서부터 묶음
+    (기사 하나가 max_bytes보다 크면 그 기사만 따로 한 조각)
+    """
+    chunks, current = [], []
+    current_size = len(_BODY_HEAD) + len(_BODY_TAIL)
+    for i, size in enumerate(sizes):
+        if current and (current_size + size + 1 > max_bytes or len(current) >= max_articles):
+            chunks.append(current)
+            current, current_size = [], len(_BODY_HEAD) + len(_BODY_TAIL)
+        current.append(i)
+        current_size += size + 1 # 쉼표
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class BulkIngestClient:
+    """
+    client = BulkIngestClient(URL_INGEST)
+    results = client.ingest(articles)          # 조각별 결과 리스트
+    failed = client.failed_articles(articles, results)
+    """
+
+    def __init__(self, url=DEFAULT_URL, max_bytes=256 * 1024, max_articles=500, workers=3, use_gzip=True,
+                 timeout=60, max_retries=3, backoff_base=1.0, backoff_max=30.0):
+        self.url = url
+        self.max_bytes = max_bytes
+        self.max_articles = max_articles
+        self.workers = workers
+        self.use_gzip = use_gzip
+        self.gzip_confirmed = False # 압축한 요청이 성공한 적 있음 (4xx는 gzip 문제가 아님)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.fatal_error = None # 인증/주소 오류가 나면 남은 조각은 보내지 않음
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _post(self, body, allow_gzip=True):
+        """요청 본문 전송 -> (응답 코드 또는 None, 오류 메시지, 실제 보낸 바이트 수)"""
+        data = body
+        headers = {"Content-Type": "application/json"}
+        compressed = allow_gzip and self.use_gzip
+        if compressed:
+            data = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            res = self.session.post(self.url, data=data, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            return None, f"{type(e).__name__}: {e}", len(data)
+        if (compressed and not self.gzip_confirmed and 400 <= res.status_code < 500
+                and res.status_code not in RETRYABLE_STATUS and res.status_code not in FATAL_STATUS):
+            # gzip을 풀지 못하는 서버는 415 대신 JSON 파싱 실패(400)로 답하는 경우가 많으므로 압축 없이 한 번 더
+            status, error, sent_bytes = self._post(body, allow_gzip=False)
+            if not error and self.use_gzip:
+                print(f"   .. 서버가 gzip 요청을 받지 않아 (HTTP {res.status_code}) 압축 없이 전송합니다.")
+                self.use_gzip = False
+            return status, error, sent_bytes
+        if 200 <= res.status_code < 300:
+            if compressed:
+                self.gzip_confirmed = True
+            return res.status_code, "", len(data)
+        return res.status_code, f"HTTP {res.status_code} {res.text[:200]}".strip(), len(data)
+
+    def _send_chunk(self, label, indices, encoded):
+        """
+        조각 하나 전송 (일시적인 실패는 재시도, 요청 내용 문제면 반으로 나눠 다시 전송)
+        반환: 결과 dict 리스트 (나눠 보냈으면 나눈 조각마다 하나씩)
+        """
+        body = _BODY_HEAD + b','.join(encoded[i] for i in indices) + _BODY_TAIL
+        if self.fatal_error:
+            return [self._result(label, indices, body, 0, None, f"전송 중단 ({self.fatal_error})")]
+
+        for attempt in range(self.max_retries + 1):
+            status, error, sent_bytes = self._post(body)
+            if not error or (status is not None and status not in RETRYABLE_STATUS) or attempt == self.max_retries:
+                break
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+            print(f"   .. 조각 {label} 전송 실패 ({error}), {delay:.1f}초 후 재시도 {attempt + 1}/{self.max_retries}")
+            time.sleep(delay)
+
+        if error and status in FATAL_STATUS:
+            if not self.fatal_error:
+                print(f"   ㄴ ❌ 인증/주소 오류 ({error}), 남은 조각은 보내지 않습니다.")
+            self.fatal_error = error
+        elif error and status in SPLITTABLE_STATUS and len(indices) > 1:
+            # 기사 하나 때문에 조각 전체가 거부됐을 수 있으므로 반씩 나눠 문제 기사만 남김
+            half = len(indices) // 2
+            return (self._send_chunk(f"{label}.1", indices[:half], encoded)
+                    + self._send_chunk(f"{label}.2", indices[half:], encoded))
+
+        return [self._result(label, indices, body, sent_bytes, status, error)]
+
+    @staticmethod
+    def _result(label, indices, body, sent_bytes, status, error):
+        return {
+            "chunk": label,
+            "indices": indices,
+            "articles": len(indices),
+            "bytes": len(body),
+            "sent_bytes": sent_bytes,
+            "status": status,
+            "ok": not error,
+            "error": error,
+        }
+
+    def ingest(self, articles):
+        """기사 리스트 전체 전송 -> 조각별 결과 dict 리스트 (원래 조각 순서)"""
+        encoded = [encode_article(article) for article in articles]
+        chunks = chunk_indices([len(e) for e in encoded], self.max_bytes, self.max_articles)
+        total_bytes = sum(len(e) for e in encoded)
+        print(f"🚀 기사 {len(articles)}건 ({total_bytes / 1024:.0f}KB)을 {len(chunks)}개 조각으로 나눠 전송 (동시 {self.workers}개)")
+
+        results = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._send_chunk, str(n), indices, encoded): n - 1
+                       for n, indices in enumerate(chunks, 1)}
+            for future in as_completed(futures):
+                chunk_results = future.result()
+                results[futures[future]] = chunk_results
+                for r in chunk_results:
+                    if r["ok"]:
+                        print(f"   ㄴ ✅ 조각 {r['chunk']}/{len(chunks)} 성공 ({r['articles']}건, "
+                              f"{r['bytes'] / 1024:.1f}KB -> {r['sent_bytes'] / 1024:.1f}KB)")
+                    else:
+                        print(f"   ㄴ ❌ 조각 {r['chunk']}/{len(chunks)} 실패 ({r['articles']}건): {r['error']}")
+        return [r for chunk_results in results for r in chunk_results]
+
+    @staticmethod
+    def failed_articles(articles, results):
+        """전송에 실패한 기사만 원래 순서대로"""
+        failed = sorted(i for r in results if not r["ok"] for i in r["indices"])
+        return [articles[i] for i in failed]
+
+    @staticmethod
+    def summary(results):
+        ok_articles = sum(r["articles"] for r in results if r["ok"])
+        total_articles = sum(r["articles"] for r in results)
+        ok_chunks = sum(1 for r in results if r["ok"])
+        return f"기사 {ok_articles}/{total_articles}건 저장 성공 (조각 {ok_chunks}/{len(results)}개)"
+
+    def close(self):
+        self.session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 기사 JSON을 조각으로 나눠 서버에 대량 저장")
+    parser.add_argument('path', help='{"articles": [...]} 형식 JSON 또는 NDJSON (csv2json.py / 날짜 수정.py 결과)')
+    parser.add_argument('--url', default=DEFAULT_URL, help=f"저장 API 주소 (기본: {DEFAULT_URL})")
+    parser.add_argument('--chunk-kb', type=int, default=256, help="조각 하나의 최대 크기(KB, 압축 전)")
+    parser.add_argument('--max-articles', type=int, default=500, help="조각 하나의 최대 기사 수")
+    parser.add_argument('--workers', type=int, default=3, help="동시에 보낼 조각 수")
+    parser.add_argument('--no-gzip', action='store_true', help="요청 본문을 압축하지 않음")
+    parser.add_argument('--failed-output', help="실패한 기사를 저장할 파일 (기본: 입력파일명_failed.json)")
+    args = parser.parse_args()
+
+    articles = list(read_articles(args.path))
+
+    client = BulkIngestClient(args.url, max_bytes=args.chunk_kb * 1024, max_articles=args.max_articles,
+                              workers=args.workers, use_gzip=not args.no_gzip)
+    results = client.ingest(articles)
+    client.close()
+    print(f"\n📊 {client.summary(results)}")
+
+    failed = client.failed_articles(articles, results)
+    if failed:
+        failed_path = args.failed_output or f"{os.path.splitext(args.path)[0]}_failed.json"
+        with open(failed_path, 'w', encoding='utf-8') as f:
+            json.dump({"articles": failed}, f, ensure_ascii=False, indent=2)
+        print(f"⚠️ 실패한 기사 {len(failed)}건 -> {failed_path} (이 파일로 다시 실행하면 실패한 기사만 전송)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+카테고리 분류 결과 캐시 (SQLite, contentHash 기준)
+
+- 같은 기사(같은 contentHash)는 다시 AI에 보내지 않고 저장된 카테고리 사용
+- 모델 이름과 프롬프트 버전을 함께 저장하므로,
+  모델이나 프롬프트를 바꾸면 이전 결과는 자동으로 무시됨
+"""
+
+import sqlite3
+from datetime import datetime
+
+
+class ClassificationCache:
+    """contentHash -> 카테고리 캐시"""
+
+    def __init__(self, db_path, model_name, prompt_version):
+        self.model_name = model_name
+        self.prompt_version = prompt_version
+        self.hits = 0
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS classifications (
+                content_hash TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                category TEXT NOT NULL,
+                classified_at TEXT,
+                PRIMARY KEY (content_hash, model_name, prompt_version)
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, content_hash):
+        """현재 모델/프롬프트 버전으로 분류된 카테고리 (없으면 None)"""
+        row = self.conn.execute(
+            "SELECT category FROM classifications WHERE content_hash = ? AND model_name = ? AND prompt_version = ?",
+            (content_hash, self.model_name, self.prompt_version)
+        ).fetchone()
+        if row is None:
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put_many(self, records):
+        """records: [(contentHash, 카테고리), ...] 를 한 트랜잭션으로 저장"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO classifications "
+                "(content_hash, model_name, prompt_version, category, classified_at) VALUES (?, ?, ?, ?, ?)",
+                [(content_hash, self.model_name, self.prompt_version, category, now)
+                 for content_hash, category in records]
+            )
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+contentHash 계산 (모든 스크립트 공통)
+
+- 제목/내용을 NFKC 정규화 + 앞뒤 공백 제거 + 연속 공백 1칸으로 줄인 뒤
+  "제목\\n내용"의 SHA-256 (hex 64자)
+- 어느 스크립트에서 계산해도 같은 기사는 같은 해시가 나와야 서버 중복 검사가 동작함
+- 여러 건은 hash_many()로 한 번에 계산 (건수가 많으면 여러 프로세스로 나눠 계산)
+
+사용법 (기존 CSV에 contentHash 컬럼 채우기):
+    python content_hash.py 분류및해시결과.csv [--workers 4]
+"""
+
+import argparse
+import hashlib
+import os
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+# 이 건수 이상이면 여러 프로세스로 나눠 계산 (적으면 프로세스 시작 비용이 더 큼)
+PARALLEL_THRESHOLD = 20000
+CHUNK_SIZE = 2000
+
+
+def normalize_text(text):
+    """텍스트 정규화: Unicode NFKC, 앞뒤 공백 제거, 연속 공백 축소"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", str(text))
+    # str.split()은 정규식 \s와 같은 공백 문자 기준이라 re.sub(r"\s+", " ", text.strip())과 결과가 같고 더 빠름
+    return " ".join(text.split())
+
+
+def compute_content_hash(title, content):
+    """contentHash 계산 (SHA-256, hex 64자)"""
+    payload = f"{normalize_text(title)}\n{normalize_text(content)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _hash_chunk(pairs):
+    return [compute_content_hash(title, content) for title, content in pairs]
+
+
+def hash_many(pairs, workers=None):
+    """
+    pairs: [(제목, 내용), ...] (리스트, zip, 제너레이터 등)
+    반환: 같은 순서의 contentHash 리스트
+    workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서만 계산)
+    """
+    pairs = list(pairs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) < PARALLEL_THRESHOLD:
+        return _hash_chunk(pairs)
+
+    chunks = [pairs[i:i + CHUNK_SIZE] for i in range(0, len(pairs), CHUNK_SIZE)]
+    hashes = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_hashes in executor.map(_hash_chunk, chunks):
+            hashes.extend(chunk_hashes)
+    return hashes
+
+
+def hash_columns(df, title_column='제목', content_column='내용', workers=None, empty_as_nan=True):
+    """
+    DataFrame의 제목/내용 컬럼 전체 -> contentHash 리스트
+    empty_as_nan: 빈 칸을 기존 분류 헤시.py처럼 문자열 'nan'으로 해시 (기본값)
+                  이미 서버에 올라간 기사와 해시가 같아야 다시 수집한 기사도 중복으로 걸러짐
+                  False면 빈 문자열로 해시 (새로 시작하는 데이터용, 기존 기사와는 해시가 달라짐)
+    """
+    titles, contents = df[title_column], df[content_column]
+    if not empty_as_nan:
+        titles, contents = titles.fillna(''), contents.fillna('')
+    return hash_many(zip(titles.astype(str), contents.astype(str)), workers=workers)
+
+
+def main():
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="CSV의 제목/내용으로 contentHash 컬럼 채우기")
+    parser.add_argument('path', help="제목, 내용 컬럼이 있는 CSV")
+    parser.add_argument('--output', help="저장할 파일 (기본: 입력 파일 덮어쓰기)")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    try:
+        df = pd.read_csv(args.path)
+    except UnicodeDecodeError:
+        df = pd.read_csv(args.path, encoding='cp949')
+
+    df['contentHash'] = hash_columns(df, workers=args.workers)
+    df.to_csv(args.output or args.path, index=False, encoding='utf-8-sig')
+    print(f"✅ {len(df)}건 contentHash 계산 완료 -> {args.output or args.path}")
+
+
+if __name__ == "__main__":
+    main()
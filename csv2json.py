@@ -1,67 +1,86 @@
 import pandas as pd
-import json
 import os
 
+from article_stream import ArticleWriter, fix_date_format, normalize_category
+
 # ==========================================
 # 사용자 설정
 # ==========================================
 INPUT_CSV_FILENAME = 'C:/Users/user/Desktop/번역및분류헤시결과.csv'  # 변환할 CSV 파일 경로
 OUTPUT_JSON_FILENAME = 'C:/Users/user/Desktop/뉴스데이터.json'      # 저장할 JSON 파일 경로
+DUPLICATES_JSON_FILENAME = 'C:/Users/user/Desktop/뉴스데이터_유사기사.json'  # 대표 기사가 아닌 유사 기사 (서버에 올리지 않음)
 
 # 수집 방식 설정 (RSS, SCRAPE, API 등)
 # 기존 코드가 RSS를 통해 수집했으므로 기본값은 'RSS'로 설정합니다.
 SOURCE_TYPE_DEFAULT = 'RSS' 
+
+# 분류 헤시.py가 묶은 유사 기사('중복그룹')는 대표 기사만 서버에 올림 (번역 비용 절감)
+# 나머지 기사는 버리지 않고 DUPLICATES_JSON_FILENAME에 duplicateOf(대표 기사 contentHash)와 함께 저장
+SKIP_NEAR_DUPLICATES = True
+
+# 출력 형식: 'json' = {"articles": [...]} (한 줄, 서버 bulk API용) / 'ndjson' = 한 줄에 기사 하나
+OUTPUT_FORMAT = 'json'
+# CSV를 이 행 수씩 나눠 읽고 바로 파일에 씀 (한 달치 이상 큰 파일도 메모리 일정)
+CHUNK_ROWS = 20000
 # ==========================================
 
+def write_articles(encoding):
+    """CSV를 나눠 읽어 기사 객체로 바꿔 바로 저장 -> (저장한 기사 수, 유사 기사 수)"""
+    reader = pd.read_csv(INPUT_CSV_FILENAME, encoding=encoding, dtype=str, keep_default_na=False, chunksize=CHUNK_ROWS)
+    print(f"'{INPUT_CSV_FILENAME}' 변환을 시작합니다... (인코딩: {encoding}, {CHUNK_ROWS}행씩)")
+
+    # 대표 기사가 아닌 유사 기사는 서버용 파일 대신 유사 기사 파일로
+    # 중간에 예외가 나면 ArticleWriter가 임시 파일을 지우므로 다른 인코딩으로 처음부터 다시 쓸 수 있음
+    with ArticleWriter(OUTPUT_JSON_FILENAME, OUTPUT_FORMAT) as writer, \
+         ArticleWriter(DUPLICATES_JSON_FILENAME, OUTPUT_FORMAT) as copy_writer:
+        for chunk in reader:
+            columns = {name: chunk[name] if name in chunk else pd.Series('', index=chunk.index)
+                       for name in ['언론사', '카테고리', '링크', '제목', '내용', '뉴스 보도 날짜', 'contentHash', '중복그룹']}
+
+            group = columns['중복그룹']
+            is_copy = (group != '') & (group != columns['contentHash'])
+            if not SKIP_NEAR_DUPLICATES:
+                is_copy = pd.Series(False, index=group.index)
+
+            for source, category, url, title, content, published, content_hash, representative, copy in zip(
+                    columns['언론사'], columns['카테고리'], columns['링크'], columns['제목'],
+                    columns['내용'], columns['뉴스 보도 날짜'], columns['contentHash'], group, is_copy):
+                article = {
+                    "sourceName": source,
+                    "sourceType": SOURCE_TYPE_DEFAULT,
+                    "categoryCode": normalize_category(category),
+                    "url": url,
+                    "title": title,
+                    "content": content,
+                    "publishedAt": fix_date_format(published) if published else '',  # 빈 날짜는 빈 값 그대로
+                    "contentHash": content_hash,
+                    # 선택 사항: 수집 시간 (fetchedAt)
+                    #"fetchedAt": 수집날짜
+                }
+                if copy:
+                    article["duplicateOf"] = representative
+                    copy_writer.write(article)
+                else:
+                    writer.write(article)
+    return writer.count, copy_writer.count
+
 def convert_csv_to_json():
-    # 1. CSV 파일 읽기
+    # 1. CSV 파일 확인
     if not os.path.exists(INPUT_CSV_FILENAME):
         print(f"오류: '{INPUT_CSV_FILENAME}' 파일을 찾을 수 없습니다.")
         return
 
     try:
-        # 인코딩 문제 발생 시 'cp949'로 시도
+        # 2. 나눠 읽은 행을 기사 객체로 바꿔 바로 저장 (카테고리/날짜도 함께 정리)
+        # 인코딩 문제 발생 시 'cp949'로 처음부터 다시 읽음
         try:
-            df = pd.read_csv(INPUT_CSV_FILENAME, encoding='utf-8-sig')
+            count, copy_count = write_articles('utf-8-sig')
         except UnicodeDecodeError:
-            df = pd.read_csv(INPUT_CSV_FILENAME, encoding='cp949')
-            
-        print(f"'{INPUT_CSV_FILENAME}' 로딩 완료. JSON 변환을 시작합니다...")
-
-        articles_list = []
-
-        # 2. 데이터 변환 루프
-        for index, row in df.iterrows():
-            # 카테고리 소문자 변환 (Politics -> politics)
-            category_raw = str(row.get('카테고리', 'others'))
-            category_code = category_raw.lower() if category_raw and category_raw.lower() in ['politics', 'economy', 'tech', 'others'] else 'others'
-
-            # 각 기사 객체 생성
-            article = {
-                "sourceName": str(row.get('언론사', '')),
-                "sourceType": SOURCE_TYPE_DEFAULT,
-                "categoryCode": category_code,
-                "url": str(row.get('링크', '')),
-                "title": str(row.get('제목', '')),
-                "content": str(row.get('내용', '')),
-                "publishedAt": str(row.get('뉴스 보도 날짜', '')),
-                "contentHash": str(row.get('contentHash', '')),
-                # 선택 사항: 수집 시간 (fetchedAt)
-                #"fetchedAt": str(row.get('수집날짜', '')) 
-            }
-            
-            articles_list.append(article)
-
-        # 3. 최종 JSON 구조 생성
-        final_data = {
-            "articles": articles_list
-        }
-
-        # 4. JSON 파일로 저장
-        with open(OUTPUT_JSON_FILENAME, 'w', encoding='utf-8') as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=2)
+            count, copy_count = write_articles('cp949')
 
-        print(f"\n[완료] 총 {len(articles_list)}건의 기사가 '{OUTPUT_JSON_FILENAME}'로 저장되었습니다.")
+        print(f"\n[완료] 총 {count}건의 기사가 '{OUTPUT_JSON_FILENAME}'로 저장되었습니다.")
+        if copy_count:
+            print(f"       (유사 기사 {copy_count}건은 '{DUPLICATES_JSON_FILENAME}'에 대표 기사와 연결해 따로 저장)")
 
     except Exception as e:
         print(f"오류 발생: {e}")
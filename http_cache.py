@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+기사 페이지 응답 디스크 캐시 (일본 뉴스 저장.py, 중국뉴스_수집기.py에서 사용)
+
+- URL의 SHA-256을 키로 본문(.body)과 메타정보(.json)를 파일로 저장
+- TTL이 지난 항목은 무시하고 삭제
+- 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 같은 날 재실행이나 디버깅할 때 네트워크 요청을 대부분 건너뜀
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ResponseCache:
+    """URL 기준 HTTP 응답 캐시 (200 응답만 저장)"""
+
+    def __init__(self, cache_dir, ttl=6 * 3600, max_bytes=500 * 1024 * 1024, enabled=True):
+        self.cache_dir = cache_dir
+        self.ttl = ttl              # 초 단위 유효 시간
+        self.max_bytes = max_bytes  # 캐시 폴더 최대 크기
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None    # 처음 저장할 때 폴더를 한 번 훑어서 계산
+
+        if enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.body', base + '.json'
+
+    def _remove(self, body_path, meta_path):
+        removed = 0
+        for path in (body_path, meta_path):
+            try:
+                removed += os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+        return removed
+
+    def get(self, url):
+        """캐시된 응답을 requests.Response로 반환 (없거나 만료되면 None)"""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if self.ttl and time.time() - meta['fetched_at'] > self.ttl:
+                removed = self._remove(body_path, meta_path)
+                with self._lock:
+                    if self._total_bytes is not None:
+                        self._total_bytes -= removed
+                return None
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # LRU 판단용으로 마지막 사용 시각 갱신
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        response = requests.models.Response()
+        response.status_code = meta.get('status', 200)
+        response.url = meta.get('url', url)
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def put(self, url, response):
+        """응답 저장 (200 응답만)"""
+        if response.status_code != 200:
+            return
+
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "status": response.status_code,
+            "fetched_at": time.time(),
+            "headers": dict(response.headers)
+        }
+        try:
+            # 다른 스레드가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+            tmp_suffix = f".{threading.get_ident()}.tmp"
+            with open(body_path + tmp_suffix, 'wb') as f:
+                f.write(response.content)
+            with open(meta_path + tmp_suffix, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(body_path + tmp_suffix, body_path)
+            os.replace(meta_path + tmp_suffix, meta_path)
+        except OSError:
+            return
+
+        added = os.path.getsize(body_path) + os.path.getsize(meta_path)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += added
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan_total(self):
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            try:
+                total += os.path.getsize(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        """오래 사용하지 않은 항목부터 삭제해 상한의 90%까지 줄임 (_lock 안에서 호출)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.body'):
+                continue
+            body_path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((os.path.getmtime(body_path), body_path))
+            except OSError:
+                pass
+        entries.sort()
+
+        target = self.max_bytes * 0.9
+        for _, body_path in entries:
+            if self._total_bytes <= target:
+                break
+            self._total_bytes -= self._remove(body_path, body_path[:-len('.body')] + '.json')
+
+    def fetch(self, url, session=None, **kwargs):
+        """
+        캐시에 있으면 캐시 응답, 없으면 GET 요청 후 저장
+        kwargs는 requests.get()에 그대로 전달 (headers, timeout 등)
+        """
+        if self.enabled:
+            cached = self.get(url)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                return cached
+
+        response = (session or requests).get(url, **kwargs)
+        if self.enabled:
+            with self._lock:
+                self.misses += 1
+            self.put(url, response)
+        return response
+
+    def summary(self):
+        """적중 통계 문자열"""
+        total = self.hits + self.misses
+        return f"응답 캐시 적중 {self.hits}/{total}건"
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+홈페이지 제목/링크 수집 (중국뉴스_수집기.py의 collect_news()에서 사용)
+
+- 파서 백엔드 선택 가능: selectolax > BeautifulSoup(lxml) > BeautifulSoup(html.parser)
+- 제목 중복 검사는 리스트 전체를 훑는 대신 해시 인덱스(set)로 처리
+- 결과는 기존 방식과 같은 순서 (h1 -> h2 -> h3 -> a, 제목 기준 첫 항목만 유지)
+- bytes 입력은 <meta charset>/BOM을 보고 먼저 디코딩 (selectolax는 항상 UTF-8로 해석하므로
+  GB2312/GBK 포털에서 제목이 깨지지 않도록)
+"""
+
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, UnicodeDammit
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # BeautifulSoup 'lxml' 파서 사용 가능 여부 확인용
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# 사용할 수 있는 백엔드 이름
+BACKENDS = ["selectolax", "lxml", "html.parser"]
+
+# 제목 길이 조건 (8자 초과 150자 미만)
+MIN_TITLE_LENGTH = 8
+MAX_TITLE_LENGTH = 150
+
+
+def resolve_backend(backend="auto"):
+    """'auto'면 설치된 것 중 가장 빠른 백엔드 선택"""
+    if backend == "auto":
+        if LexborHTMLParser is not None:
+            return "selectolax"
+        if HAS_LXML:
+            return "lxml"
+        return "html.parser"
+    if backend == "selectolax" and LexborHTMLParser is None:
+        raise ValueError("selectolax가 설치되어 있지 않습니다 (pip install selectolax)")
+    if backend == "lxml" and not HAS_LXML:
+        raise ValueError("lxml이 설치되어 있지 않습니다 (pip install lxml)")
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {backend}")
+    return backend
+
+
+def decode_html(html):
+    """bytes면 BOM/<meta charset>/내용 추정으로 str 디코딩 (bs4와 같은 규칙)"""
+    if isinstance(html, str):
+        return html
+    dammit = UnicodeDammit(html, is_html=True)
+    if dammit.unicode_markup is not None:
+        return dammit.unicode_markup
+    return html.decode('utf-8', errors='replace')
+
+
+def _iter_candidates_bs4(html, parser):
+    """(제목, 링크) 후보를 문서 순서대로 반환 - BeautifulSoup"""
+    soup = BeautifulSoup(html, parser)
+
+    # h1, h2, h3: 태그 안 첫 번째 <a>의 href (없으면 빈 링크)
+    for tag_name in ['h1', 'h2', 'h3']:
+        for tag in soup.find_all(tag_name):
+            a_tag = tag.find('a')
+            href = a_tag.get('href') if a_tag else None
+            yield "heading", tag.get_text(strip=True), href
+
+    # a 태그
+    for a_tag in soup.find_all('a'):
+        yield "anchor", a_tag.get_text(strip=True), a_tag.get('href', '')
+
+
+def _iter_candidates_selectolax(html):
+    """(제목, 링크) 후보를 문서 순서대로 반환 - selectolax"""
+    tree = LexborHTMLParser(html)
+
+    for tag_name in ['h1', 'h2', 'h3']:
+        for node in tree.css(tag_name):
+            a_node = node.css_first('a')
+            href = a_node.attributes.get('href') if a_node is not None else None
+            yield "heading", node.text(deep=True, separator='', strip=True), href
+
+    for a_node in tree.css('a'):
+        yield "anchor", a_node.text(deep=True, separator='', strip=True), a_node.attributes.get('href') or ''
+
+
+def harvest_links(html, base_url, spam_matcher, backend="auto"):
+    """
+    홈페이지 HTML에서 뉴스 제목과 링크 수집
+    spam_matcher: text_filter.KeywordMatcher (제목에 스팸 키워드가 있으면 제외)
+    반환: [{"title": 제목, "link": 링크}, ...] (제목 기준 중복 제거)
+    """
+    backend = resolve_backend(backend)
+    if backend == "selectolax":
+        candidates = _iter_candidates_selectolax(decode_html(html))
+    else:
+        candidates = _iter_candidates_bs4(html, backend)
+
+    results = []
+    seen_titles = set() # 제목 해시 인덱스
+
+    for kind, title, href in candidates:
+        if spam_matcher.search(title) or not (MIN_TITLE_LENGTH < len(title) < MAX_TITLE_LENGTH):
+            continue
+        if title in seen_titles:
+            continue
+
+        if kind == "heading":
+            link = href or ""
+        else:
+            link = href
+            if not link or link.startswith('javascript'):
+                continue
+
+        if link and not link.startswith('http'):
+            link = urljoin(base_url, link)
+
+        seen_titles.add(title)
+        results.append({"title": title, "link": link})
+
+    return results
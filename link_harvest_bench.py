@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+홈페이지 링크 수집 벤치마크 (links/sec)
+
+저장해 둔 홈페이지 HTML로 기존 방식(html.parser + 리스트 전체 중복 검사)과
+link_harvest.py의 각 파서 백엔드를 비교합니다.
+
+사용법:
+    python link_harvest_bench.py <저장된 html 폴더 또는 파일...> [--repeat 5]
+
+홈페이지 저장 예:
+    curl -L -o pages/people.html http://www.people.com.cn/
+"""
+
+import argparse
+import glob
+import os
+import time
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from link_harvest import BACKENDS, harvest_links, resolve_backend
+from text_filter import KeywordMatcher
+
+# 중국뉴스_수집기.py의 collect_news()와 같은 스팸 키워드
+SPAM_KEYWORDS = [
+    '·', '栏目', '分类', '导航', '菜单', '更多', '首页',
+    '订阅', '登录', '注册', '频道', '搜索', '用户', '广告',
+    'Русский', 'Português', 'English', 'Français', '日本語',
+    '403', '404', 'Forbidden', 'Error', '错误',
+    '扫码', '微信', '长按', '关注',
+    '备案', '版权', 'ICP', '联系', '关于',
+    '精彩内容', '最新视频', 'THE LATEST',
+]
+
+SPAM_MATCHER = KeywordMatcher(SPAM_KEYWORDS)
+
+BASE_URL = "http://localhost/"
+
+
+def legacy_harvest(html, url, spam_keywords):
+    """기존 collect_news()의 수집 로직 그대로 (비교 기준)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    raw_news = []
+
+    for tag_name in ['h1', 'h2', 'h3']:
+        for tag in soup.find_all(tag_name):
+            title = tag.get_text(strip=True)
+            if any(keyword in title for keyword in spam_keywords) or not (8 < len(title) < 150):
+                continue
+
+            link = ""
+            a_tag = tag.find('a')
+            if a_tag and a_tag.get('href'):
+                link = a_tag.get('href')
+                if not link.startswith('http'):
+                    link = urljoin(url, link)
+
+            raw_news.append({"title_zh": title, "link": link})
+
+    for a_tag in soup.find_all('a'):
+        title = a_tag.get_text(strip=True)
+        link = a_tag.get('href', '')
+
+        if any(keyword in title for keyword in spam_keywords) or not (8 < len(title) < 150):
+            continue
+        if not link or link.startswith('javascript') or any(item['title_zh'] == title for item in raw_news):
+            continue
+
+        if not link.startswith('http'):
+            link = urljoin(url, link)
+
+        raw_news.append({"title_zh": title, "link": link})
+
+    unique_news = []
+    seen = set()
+    for item in raw_news:
+        if item['title_zh'] not in seen:
+            seen.add(item['title_zh'])
+            unique_news.append({"title": item['title_zh'], "link": item['link']})
+    return unique_news
+
+
+def load_pages(paths):
+    """폴더/파일 경로에서 html 파일 읽기"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.htm*'))))
+        else:
+            files.append(path)
+
+    pages = []
+    for file in files:
+        with open(file, 'rb') as f:
+            pages.append((os.path.basename(file), f.read()))
+    return pages
+
+
+def run(name, harvest, pages, repeat):
+    """harvest(html) 실행 시간 측정 -> (links/sec, 페이지별 결과)"""
+    results = [harvest(html) for _, html in pages] # 워밍업 + 결과 확인용
+    total_links = sum(len(r) for r in results)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, html in pages:
+            harvest(html)
+    elapsed = time.perf_counter() - start
+
+    rate = total_links * repeat / elapsed if elapsed > 0 else 0
+    print(f"  {name:<14} {total_links:>6}개 링크  {elapsed / repeat * 1000:>9.1f} ms/회  {rate:>10.0f} links/sec")
+    return rate, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="홈페이지 링크 수집 벤치마크")
+    parser.add_argument('paths', nargs='+', help="저장된 홈페이지 html 파일 또는 폴더")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (기본 5)")
+    args = parser.parse_args()
+
+    pages = load_pages(args.paths)
+    if not pages:
+        print("❌ html 파일이 없습니다.")
+        return
+
+    print(f"📄 페이지 {len(pages)}개, 반복 {args.repeat}회\n")
+
+    base_rate, base_results = run("legacy", lambda html: legacy_harvest(html, BASE_URL, SPAM_KEYWORDS), pages, args.repeat)
+
+    for backend in BACKENDS:
+        try:
+            resolve_backend(backend)
+        except ValueError as e:
+            print(f"  {backend:<14} 건너뜀 ({e})")
+            continue
+
+        rate, results = run(backend, lambda html: harvest_links(html, BASE_URL, SPAM_MATCHER, backend=backend), pages, args.repeat)
+
+        # 파서가 달라지면 깨진 HTML 해석이 조금씩 다를 수 있으므로 차이만 보고
+        diff_pages = [name for (name, _), a, b in zip(pages, base_results, results) if a != b]
+        speedup = rate / base_rate if base_rate else 0
+        note = "결과 동일" if not diff_pages else f"결과 차이 {len(diff_pages)}개 페이지: {', '.join(diff_pages[:3])}"
+        print(f"  {'':<14} x{speedup:.1f} ({note})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+AI API 호출 속도 제한 + 동시 요청 (Gemini, Claude 공통)
+
+- 분당 요청 수(RPM)와 분당 토큰 수(TPM) 한도를 토큰 버킷으로 관리
+- time.sleep(1)로 한 건씩 보내는 대신, 한도 안에서 여러 요청을 동시에 보냄
+- 응답에 실제 사용 토큰 수가 있으면 예상치와의 차이를 버킷에 반영
+- API SDK가 동기 방식이라 실제 호출은 스레드에서 실행하고, 묶음 실행은 asyncio로 관리
+- 429(요청 한도 초과)/5xx/타임아웃은 지수 백오프 + 지터로 재시도, 서버가 알려준 대기 시간이 있으면 따름
+- 연속으로 실패하면 회로 차단기(circuit breaker)를 열어 한동안 요청을 보내지 않음
+- map(requeue_rounds=N): 실패한 항목(None 반환)은 버리지 않고 뒤로 돌려 다시 시도
+
+사용 예:
+    llm = LLMClient(model.generate_content, rpm=15, tpm=1_000_000)
+    response = llm.generate(prompt)                 # 한 건 (한도까지 기다렸다가 호출, 실패 시 재시도)
+    results = llm.map(classify, articles)           # 여러 건 동시 실행, 입력 순서대로 결과
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 서버 과부하/일시 오류)
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504, 529}
+# 상태 코드가 없는 예외 중 재시도할 것 (SDK를 import하지 않고 클래스 이름으로 판단)
+RETRYABLE_ERROR_NAMES = {
+    'ResourceExhausted', 'ServiceUnavailable', 'DeadlineExceeded', 'InternalServerError', # Gemini
+    'RateLimitError', 'OverloadedError', 'APIConnectionError', 'APITimeoutError',          # Claude
+    'Timeout', 'ConnectionError', 'TimeoutError',
+}
+
+# 토큰 수 추정 (한국어/일본어/중국어는 글자당 1토큰 안팎이라 보수적으로 잡음)
+CHARS_PER_TOKEN = 2
+
+
+def estimate_tokens(text):
+    return len(str(text)) // CHARS_PER_TOKEN + 1
+
+
+def response_tokens(response):
+    """응답 객체의 실제 사용 토큰 수 (알 수 없으면 None)"""
+    usage = getattr(response, 'usage_metadata', None) # Gemini
+    if usage is not None and getattr(usage, 'total_token_count', None):
+        return usage.total_token_count
+    usage = getattr(response, 'usage', None)          # Claude
+    if usage is not None and getattr(usage, 'input_tokens', None) is not None:
+        return usage.input_tokens + (usage.output_tokens or 0)
+    return None
+
+
+def error_status(error):
+    """예외에서 HTTP 상태 코드 추출 (없으면 None)"""
+    for attr in ('status_code', 'code'): # Claude: status_code, Gemini(google.api_core): code
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+def is_retryable(error):
+    if error_status(error) in RETRYABLE_STATUS:
+        return True
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def is_rate_limited(error):
+    return error_status(error) == 429 or type(error).__name__ in ('ResourceExhausted', 'RateLimitError')
+
+
+def retry_after(error):
+    """서버가 알려준 재시도 대기 시간(초), 없으면 None"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    value = headers.get('retry-after') if hasattr(headers, 'get') else None
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    # Gemini는 메시지 안에 대기 시간을 넣어 보냄 ("retry_delay { seconds: 13 }", "Please retry in 13.2s")
+    match = re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)|retry in ([\d.]+)\s*s', str(error))
+    if match:
+        return float(match.group(1) or match.group(2))
+    return None
+
+
+class CircuitOpenError(RuntimeError):
+    """회로 차단기가 열려 있어 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 열림(요청 차단)
+    reset_timeout초 뒤 한 건만 시험 삼아 보내 보고, 성공하면 닫힘 / 실패하면 다시 열림
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True # 반열림: 시험 요청 한 건만 통과
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._trial_running:
+                    print(f"   !! AI API 연속 실패 {self.failures}회 - {self.reset_timeout}초 동안 요청 중단")
+                self.opened_at = time.monotonic()
+                self._trial_running = False
+
+    def seconds_until_retry(self):
+        with self._lock:
+            if self.opened_at is None:
+                return 0
+            return max(0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+class TokenBucket:
+    """분당 per_minute만큼 채워지는 버킷 (여러 스레드에서 함께 사용)"""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0 # 초당 채워지는 양
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount=1):
+        """amount만큼 꺼낼 수 있을 때까지 기다림"""
+        amount = min(amount, self.capacity) # 한도보다 큰 요청도 언젠가는 통과
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def adjust(self, amount):
+        """예상보다 적게 썼으면 돌려주고(+), 많이 썼으면 더 차감(-)"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LLMClient:
+    """
+    generate: 실제 API 호출 함수 (prompt, **kwargs) -> 응답
+    rpm / tpm: 분당 요청 수 / 토큰 수 한도 (tpm=None이면 토큰 한도 없음)
+    max_concurrency: 동시에 보낼 최대 요청 수
+    max_output_tokens: 응답 토큰 예상치 (TPM 계산용)
+    max_retries: 재시도 가능한 오류일 때 최대 재시도 횟수
+    backoff_base / backoff_max: 재시도 대기 시간 (base * 2^n초, 최대 backoff_max초, 0~그 값 사이 무작위)
+    """
+
+    def __init__(self, generate, rpm=15, tpm=None, max_concurrency=8, max_output_tokens=1024,
+                 max_retries=5, backoff_base=1.0, backoff_max=60.0, breaker=None):
+        self._generate = generate
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.max_concurrency = max_concurrency
+        self.max_output_tokens = max_output_tokens
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self._paused_until = 0.0 # 429를 받으면 모든 스레드가 이 시각까지 대기
+        self._pause_lock = threading.Lock()
+
+    def _wait_if_paused(self):
+        while True:
+            with self._pause_lock:
+                wait = self._paused_until - time.monotonic()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def _pause(self, seconds):
+        with self._pause_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _backoff(self, attempt, error):
+        """재시도 전 대기 시간 (서버가 알려준 시간 우선, 없으면 지수 백오프 + 전체 지터)"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        hinted = retry_after(error)
+        if hinted is not None:
+            delay = max(delay, hinted)
+        return delay
+
+    def generate(self, prompt, estimated_tokens=None, **kwargs):
+        """
+        한도 안에서 API 호출 (스레드 안전, 한도에 걸리면 기다림)
+        재시도할 수 없는 오류이거나 재시도를 다 쓰면 마지막 예외를 그대로 발생
+        회로 차단기가 열려 있으면 CircuitOpenError
+        """
+        estimate = estimated_tokens or estimate_tokens(prompt) + self.max_output_tokens
+
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"AI API 요청 중단 중 ({self.breaker.seconds_until_retry():.0f}초 후 재개)")
+
+            self._wait_if_paused()
+            self.requests.acquire(1)
+            if self.tokens:
+                self.tokens.acquire(estimate)
+
+            try:
+                response = self._generate(prompt, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success() # 요청 자체의 문제(잘못된 입력 등)는 API 장애로 보지 않음
+                    raise
+                self.breaker.record_failure()
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                if is_rate_limited(e):
+                    self._pause(delay) # 한도 초과는 다른 요청들도 함께 쉬어야 함
+                print(f"   !! AI API 오류 ({type(e).__name__}), {delay:.1f}초 후 재시도 {attempt + 1}/{self.max_retries}")
+                time.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            actual = response_tokens(response)
+            if self.tokens and actual is not None:
+                self.tokens.adjust(estimate - actual)
+            return response
+
+    def wait_until_available(self):
+        """회로 차단기가 열려 있으면 다시 시도할 수 있을 때까지 대기"""
+        wait = self.breaker.seconds_until_retry()
+        if wait > 0:
+            print(f"   .. AI API 재개까지 {wait:.0f}초 대기")
+            time.sleep(wait)
+
+    async def agenerate(self, prompt, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: self.generate(prompt, **kwargs))
+
+    async def amap(self, func, items):
+        """func(item)을 최대 max_concurrency개씩 동시에 실행, 입력 순서대로 결과 반환"""
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return await asyncio.gather(*(loop.run_in_executor(executor, func, item) for item in items))
+
+    def map(self, func, items, requeue_rounds=0):
+        """
+        amap()의 동기 버전 (func 안에서 generate()를 호출하면 한도가 함께 적용됨)
+        requeue_rounds: func가 None을 반환(실패)한 항목을 모아 다시 시도할 횟수
+                        끝까지 실패한 항목의 결과는 None
+        """
+        items = list(items)
+        if not items:
+            return []
+        results = run_sync(self.amap(func, items))
+
+        for round_num in range(1, requeue_rounds + 1):
+            failed = [i for i, result in enumerate(results) if result is None]
+            if not failed:
+                break
+            print(f"   .. 실패한 {len(failed)}건 다시 시도 ({round_num}/{requeue_rounds})")
+            self.wait_until_available()
+            retried = run_sync(self.amap(func, [items[i] for i in failed]))
+            for i, result in zip(failed, retried):
+                results[i] = result
+        return results
+
+
+def run_sync(coro):
+    """코루틴 실행 (Colab/Jupyter처럼 이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 카테고리 분류기 (TF-IDF 문자 n-gram + 로지스틱 회귀, CPU만 사용)
+
+- 이미 분류된 결과 CSV(제목/내용/카테고리)로 학습
+- 문자 단위 n-gram이라 띄어쓰기가 없는 일본어/중국어, 아랍어에도 그대로 사용 가능
+- 예측 확률(신뢰도)을 함께 돌려주므로, 신뢰도가 낮은 기사만 AI에 보내면 됨
+- 학습한 모델은 파일로 저장하고, 학습 CSV가 바뀌었을 때만 다시 학습
+
+사용법 (임계값별 정확도 확인):
+    python local_classifier.py result/번역및분류결과.csv --threshold 0.6
+"""
+
+import argparse
+import os
+import pickle
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+
+CATEGORIES = ['Politics', 'Economy', 'Tech', 'Others']
+
+# 학습에 필요한 최소 행 수 (이보다 적으면 로컬 분류 사용 안 함)
+MIN_TRAINING_ROWS = 30
+
+# AI 분류와 같은 입력 (제목 + 내용 앞 500자)
+CONTENT_CHARS = 500
+
+
+def article_text(title, content):
+    """분류에 사용할 텍스트"""
+    return f"{title}\n{str(content)[:CONTENT_CHARS]}"
+
+
+def read_labeled_csv(path):
+    """제목/내용/카테고리가 있는 CSV -> ([(제목, 내용), ...], 라벨 리스트)"""
+    try:
+        df = pd.read_csv(path)
+    except UnicodeDecodeError:
+        df = pd.read_csv(path, encoding='cp949')
+
+    if '카테고리' not in df.columns:
+        return [], []
+    df = df[df['카테고리'].isin(CATEGORIES)].fillna({'제목': '', '내용': ''})
+    return list(zip(df['제목'], df['내용'])), df['카테고리'].tolist()
+
+
+def build_pipeline():
+    return Pipeline([
+        ('tfidf', TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 4), sublinear_tf=True,
+                                  min_df=2, max_features=200000)),
+        ('clf', LogisticRegression(max_iter=1000, class_weight='balanced')),
+    ])
+
+
+def _files_signature(csv_paths):
+    """학습 파일 목록과 수정 시각 (바뀌면 재학습)"""
+    return [(path, os.path.getmtime(path)) for path in csv_paths if os.path.exists(path)]
+
+
+class LocalClassifier:
+    """학습된 로컬 분류기"""
+
+    def __init__(self, pipeline, signature=None, n_rows=0):
+        self.pipeline = pipeline
+        self.signature = signature or []
+        self.n_rows = n_rows
+
+    @classmethod
+    def train(cls, csv_paths):
+        """CSV 파일들로 학습 (학습 데이터가 부족하면 None)"""
+        articles, labels = [], []
+        for path in csv_paths:
+            if os.path.exists(path):
+                a, l = read_labeled_csv(path)
+                articles.extend(a)
+                labels.extend(l)
+
+        if len(articles) < MIN_TRAINING_ROWS or len(set(labels)) < 2:
+            return None
+
+        pipeline = build_pipeline()
+        pipeline.fit([article_text(title, content) for title, content in articles], labels)
+        return cls(pipeline, _files_signature(csv_paths), len(articles))
+
+    @classmethod
+    def load_or_train(cls, model_path, csv_paths):
+        """저장된 모델이 최신이면 불러오고, 아니면 다시 학습해서 저장"""
+        if os.path.exists(model_path):
+            try:
+                with open(model_path, 'rb') as f:
+                    saved = pickle.load(f)
+                if saved.signature == _files_signature(csv_paths):
+                    return saved
+            except Exception:
+                pass # 깨졌거나 버전이 다른 모델 파일은 다시 학습
+
+        classifier = cls.train(csv_paths)
+        if classifier is not None:
+            try:
+                with open(model_path, 'wb') as f:
+                    pickle.dump(classifier, f)
+            except OSError:
+                pass
+        return classifier
+
+    def predict(self, articles):
+        """
+        articles: [(제목, 내용), ...]
+        반환: 같은 순서의 (카테고리, 신뢰도) 리스트
+        """
+        if not articles:
+            return []
+        texts = [article_text(title, content) for title, content in articles]
+        probabilities = self.pipeline.predict_proba(texts)
+        classes = self.pipeline.classes_
+        return [(classes[row.argmax()], float(row.max())) for row in probabilities]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 분류기 정확도 확인 (학습 80% / 검증 20%)")
+    parser.add_argument('paths', nargs='+', help="카테고리가 있는 결과 CSV")
+    parser.add_argument('--threshold', type=float, default=0.6, help="신뢰도 임계값 (기본 0.6)")
+    args = parser.parse_args()
+
+    articles, labels = [], []
+    for path in args.paths:
+        a, l = read_labeled_csv(path)
+        articles.extend(a)
+        labels.extend(l)
+    if len(articles) < MIN_TRAINING_ROWS:
+        print(f"❌ 학습 데이터가 부족합니다 ({len(articles)}건, 최소 {MIN_TRAINING_ROWS}건)")
+        return
+
+    train_articles, test_articles, train_labels, test_labels = train_test_split(
+        articles, labels, test_size=0.2, random_state=42)
+    pipeline = build_pipeline().fit([article_text(t, c) for t, c in train_articles], train_labels)
+    predictions = LocalClassifier(pipeline).predict(test_articles)
+
+    confident = [(pred, label) for (pred, conf), label in zip(predictions, test_labels) if conf >= args.threshold]
+    total_acc = sum(pred == label for (pred, _), label in zip(predictions, test_labels)) / len(test_labels)
+    print(f"📄 학습 {len(train_articles)}건, 검증 {len(test_articles)}건")
+    print(f"  전체 정확도: {total_acc:.1%}")
+    if confident:
+        acc = sum(pred == label for pred, label in confident) / len(confident)
+        print(f"  신뢰도 {args.threshold} 이상: {len(confident)}/{len(test_labels)}건 ({len(confident) / len(test_labels):.0%}), 정확도 {acc:.1%}")
+    else:
+        print(f"  신뢰도 {args.threshold} 이상인 기사가 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
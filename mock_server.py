@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+부하 테스트용 가짜 서버 (실제 백엔드 없이 수집/번역 클라이언트 성능·재시도 확인)
+
+실제 서버(http://localhost:8080)와 같은 주소를 흉내냄 (표준 라이브러리만 사용)
+    POST /api/admin/ingestion/articles:bulk   원본 기사 저장 ({"articles": [...]}, contentHash 중복은 건너뜀)
+    GET  /api/llm/pull?languageTarget=ko&limit=10   번역 결과가 아직 없는 기사 (오래된 순)
+    POST /api/llm/results                     번역 결과 저장 (한 건 또는 {"items": [...]})
+    POST /api/llm/results:bulk                번역 결과 여러 건 저장 ({"items": [...]})
+    GET  /api/mock/stats                      요청 수, 주입한 오류 수, 큐 상태 등
+
+- 저장소는 메모리 (종료하면 사라짐), gzip 요청 본문(Content-Encoding: gzip) 지원
+- --latency-ms / --jitter-ms : 응답마다 지연 추가
+- --error-rate : 이 확률로 503, --rate-limit-rate : 이 확률로 429 + Retry-After
+- --lease-seconds : pull한 기사를 이 시간 동안 다른 pull에서 빼 둠 (0이면 결과가 올 때까지 계속 다시 나옴)
+- title/url이 비어 있는 기사가 섞인 bulk 요청은 400 (bulk_ingest.py의 문제 기사 골라내기 확인용)
+
+사용법:
+    python mock_server.py [--port 8080] [--seed-articles 1000] [--latency-ms 50] [--error-rate 0.05]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import zlib
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from content_hash import compute_content_hash
+
+INGEST_PATH = "/api/admin/ingestion/articles:bulk"
+PULL_PATH = "/api/llm/pull"
+RESULTS_PATH = "/api/llm/results"
+RESULTS_BULK_PATH = "/api/llm/results:bulk"
+STATS_PATH = "/api/mock/stats"
+
+REQUIRED_ARTICLE_FIELDS = ["title", "url"]
+REQUIRED_RESULT_FIELDS = ["articleId", "languageTarget", "translatedContent"]
+
+
+class MockStore:
+    """기사/번역 결과 메모리 저장소 (요청 스레드 여러 개에서 함께 사용)"""
+
+    def __init__(self, lease_seconds=0):
+        self.lease_seconds = lease_seconds
+        self.articles = {}  # articleId -> 기사
+        self.hashes = {}    # contentHash -> articleId
+        self.results = {}   # (articleId, 언어) -> 번역 결과
+        self.leases = {}    # (articleId, 언어) -> 임대 만료 시각
+        self.counters = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_articles(self, articles):
+        """-> (새로 저장한 수, 중복 수)"""
+        inserted = duplicates = 0
+        with self._lock:
+            for article in articles:
+                content_hash = article.get("contentHash") or compute_content_hash(article.get("title"), article.get("content"))
+                if content_hash in self.hashes:
+                    duplicates += 1
+                    continue
+                article_id = self._next_id
+                self._next_id += 1
+                self.hashes[content_hash] = article_id
+                self.articles[article_id] = dict(article, articleId=article_id, contentHash=content_hash)
+                inserted += 1
+        return inserted, duplicates
+
+    def pull(self, language, limit):
+        now = time.monotonic()
+        items = []
+        with self._lock:
+            for article_id, article in self.articles.items(): # dict는 넣은 순서 = 오래된 순
+                if len(items) >= limit: # limit=0이면 아무것도 빌려주지 않음
+                    break
+                key = (article_id, language)
+                if key in self.results or self.leases.get(key, 0) > now:
+                    continue
+                if self.lease_seconds:
+                    self.leases[key] = now + self.lease_seconds
+                items.append({
+                    "articleId": article_id,
+                    "title": article.get("title", ""),
+                    "content": article.get("content", ""),
+                    "sourceName": article.get("sourceName", ""),
+                    "publishedAt": article.get("publishedAt", ""),
+                })
+        return items
+
+    def add_results(self, results):
+        """-> (저장한 수, 이미 있던 결과를 덮어쓴 수)"""
+        stored = overwritten = 0
+        with self._lock:
+            for result in results:
+                key = (result["articleId"], result["languageTarget"])
+                if key in self.results:
+                    overwritten += 1
+                self.results[key] = result
+                self.leases.pop(key, None)
+                stored += 1
+        return stored, overwritten
+
+    def stats(self):
+        with self._lock:
+            return {
+                "articles": len(self.articles),
+                "results": len(self.results),
+                "counters": dict(self.counters),
+            }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive 연결 재사용 확인용
+    store = None
+    options = None
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+    # ---------- 공통 ----------
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.store.count("bytes_in", len(raw))
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            self.store.count("gzip_requests")
+            raw = gzip.decompress(raw)
+        return json.loads(raw or b"null")
+
+    def _inject(self):
+        """지연/오류 주입 -> 오류 응답을 보냈으면 True"""
+        opts = self.options
+        if opts.latency_ms or opts.jitter_ms:
+            time.sleep((opts.latency_ms + random.uniform(0, opts.jitter_ms)) / 1000)
+        roll = random.random()
+        if roll < opts.rate_limit_rate:
+            self.store.count("injected_429")
+            self._discard_body()
+            self._send_json(429, {"error": "mock rate limit"}, {"Retry-After": str(opts.retry_after)})
+            return True
+        if roll < opts.rate_limit_rate + opts.error_rate:
+            self.store.count("injected_503")
+            self._discard_body()
+            self._send_json(503, {"error": "mock unavailable"})
+            return True
+        return False
+
+    def _discard_body(self):
+        # keep-alive 연결에서 다음 요청이 어긋나지 않도록 본문은 읽어서 버림
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+    # ---------- 라우팅 ----------
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == STATS_PATH:
+            return self._send_json(200, self.store.stats())
+        if url.path != PULL_PATH:
+            return self._send_json(404, {"error": f"unknown path {url.path}"})
+
+        self.store.count("pull_requests")
+        if self._inject():
+            return
+        query = parse_qs(url.query)
+        language = query.get("languageTarget", ["ko"])[0]
+        try:
+            limit = int(query.get("limit", ["10"])[0])
+        except ValueError:
+            limit = -1
+        if limit < 0:
+            self.store.count("bad_requests")
+            return self._send_json(400, {"error": "'limit' must be a non-negative integer"})
+        items = self.store.pull(language, limit)
+        self.store.count("pulled_items", len(items))
+        self._send_json(200, {"items": items})
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path not in (INGEST_PATH, RESULTS_PATH, RESULTS_BULK_PATH):
+            self._discard_body()
+            return self._send_json(404, {"error": f"unknown path {path}"})
+
+        self.store.count("ingest_requests" if path == INGEST_PATH else "result_requests")
+        if self._inject():
+            return
+        try:
+            body = self._read_json()
+        except (ValueError, OSError, EOFError, zlib.error) as e: # 잘린 gzip 본문은 EOFError
+            self.store.count("bad_requests")
+            return self._send_json(400, {"error": f"invalid body: {e}"})
+
+        if path == INGEST_PATH:
+            return self._ingest(body)
+        return self._results(body)
+
+    def _ingest(self, body):
+        articles = body.get("articles") if isinstance(body, dict) else None
+        if not isinstance(articles, list):
+            self.store.count("bad_requests")
+            return self._send_json(400, {"error": "'articles' list is required"})
+        invalid = [i for i, a in enumerate(articles)
+                   if not isinstance(a, dict) or not all(a.get(f) for f in REQUIRED_ARTICLE_FIELDS)]
+        if invalid:
+            self.store.count("bad_requests")
+            return self._send_json(400, {"error": f"missing {REQUIRED_ARTICLE_FIELDS}", "invalidIndexes": invalid[:20]})
+        inserted, duplicates = self.store.add_articles(articles)
+        self.store.count("ingested_articles", inserted)
+        self.store.count("duplicate_articles", duplicates)
+        self._send_json(200, {"received": len(articles), "inserted": inserted, "duplicates": duplicates})
+
+    def _results(self, body):
+        results = body.get("items") if isinstance(body, dict) and "items" in body else [body]
+        if not isinstance(results, list) or not all(
+                isinstance(r, dict) and all(r.get(f) not in (None, "") for f in REQUIRED_RESULT_FIELDS) for r in results):
+            self.store.count("bad_requests")
+            return self._send_json(400, {"error": f"each result needs {REQUIRED_RESULT_FIELDS}"})
+        stored, overwritten = self.store.add_results(results)
+        self.store.count("stored_results", stored)
+        self.store.count("overwritten_results", overwritten)
+        self._send_json(200, {"stored": stored, "overwritten": overwritten})
+
+
+def seed_articles(store, count, content_chars=1200):
+    """가짜 기사 count건을 큐에 넣음 (번역 클라이언트만 따로 시험할 때)"""
+    now = datetime.now().astimezone().isoformat()
+    paragraph = "これはテスト用の記事本文です。" * 4
+    articles = []
+    for i in range(1, count + 1):
+        content = "\n".join([f"[{i}] {paragraph}"] * max(1, content_chars // (len(paragraph) + 5)))
+        articles.append({
+            "sourceName": "mock",
+            "sourceType": "RSS",
+            "categoryCode": "others",
+            "url": f"http://mock.local/articles/{i}",
+            "title": f"テスト記事 {i}",
+            "content": content,
+            "publishedAt": now,
+        })
+    store.add_articles(articles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집/번역 API 가짜 서버 (부하 테스트용)")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--seed-articles', type=int, default=0, help="시작할 때 큐에 넣을 가짜 기사 수")
+    parser.add_argument('--latency-ms', type=float, default=0, help="응답마다 더할 지연(ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="0~이 값(ms) 사이 무작위 지연 추가")
+    parser.add_argument('--error-rate', type=float, default=0, help="503을 돌려줄 확률 (0~1)")
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help="429를 돌려줄 확률 (0~1)")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument('--lease-seconds', type=float, default=0, help="pull한 기사를 다른 pull에서 빼 둘 시간(초)")
+    parser.add_argument('--seed', type=int, default=None, help="오류 주입 난수 seed (요청을 한 번에 하나씩 보낼 때만 같은 순서로 재현, 동시 요청은 스레드 순서에 따라 달라짐)")
+    parser.add_argument('--verbose', action='store_true', help="요청마다 로그 출력")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    store = MockStore(lease_seconds=args.lease_seconds)
+    if args.seed_articles:
+        seed_articles(store, args.seed_articles)
+
+    MockHandler.store = store
+    MockHandler.options = args
+    server = ThreadingHTTPServer((args.host, args.port), MockHandler)
+    server.daemon_threads = True
+    print(f"🧪 가짜 서버 시작: http://{args.host}:{args.port} (기사 {len(store.articles)}건, "
+          f"지연 {args.latency_ms:g}+{args.jitter_ms:g}ms, 503 {args.error_rate:.0%}, 429 {args.rate_limit_rate:.0%})")
+    print(f"   통계: http://{args.host}:{args.port}{STATS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n🛑 종료 - {json.dumps(store.stats(), ensure_ascii=False)}")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+유사 기사(같은 통신사 기사를 여러 언론사가 조금씩 고쳐 실은 경우) 묶기
+
+- 제목+본문을 글자 단위 n-gram 집합으로 보고 MinHash 서명을 계산
+- LSH(서명을 여러 구간으로 나눠 구간이 하나라도 같으면 후보)로 후보만 골라 비교
+  구간 수/구간 길이는 임계값에서 후보로 잡힐 확률(재현율)이 min_recall 이상이 되도록 자동 선택
+  (기본 num_perm=64, threshold=0.5 -> 32구간 x 2행, 유사도 0.5인 쌍을 놓칠 확률 약 0.01%)
+- 추정 유사도(Jaccard)가 임계값 이상이면 먼저 들어온 기사를 대표로 같은 그룹에 묶음
+- 띄어쓰기가 없는 일본어/중국어도 글자 단위라 그대로 동작
+"""
+
+import zlib
+
+import numpy as np
+
+from content_hash import normalize_text
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def lsh_recall(similarity, bands, rows):
+    """유사도가 similarity인 두 기사가 구간 하나 이상에서 겹쳐 후보가 될 확률"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def choose_bands(threshold, num_perm, min_recall=0.99):
+    """
+    임계값에서 재현율이 min_recall 이상인 (구간 수, 구간 길이) 중 구간 길이가 가장 긴 것
+    (구간이 길수록 유사도가 낮은 후보가 줄어 비교 횟수가 적음)
+    """
+    for rows in sorted((r for r in range(1, num_perm + 1) if num_perm % r == 0), reverse=True):
+        bands = num_perm // rows
+        if lsh_recall(threshold, bands, rows) >= min_recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class NearDuplicateIndex:
+    """
+    index = NearDuplicateIndex()
+    rep = index.add("기사 키", "제목 본문")  # 비슷한 기사가 이미 있으면 그 대표 키, 없으면 자기 키
+    """
+
+    def __init__(self, threshold=0.5, num_perm=64, bands=None, shingle_size=4, seed=1, min_recall=0.99):
+        if bands is None:
+            bands, _ = choose_bands(threshold, num_perm, min_recall)
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.recall = lsh_recall(threshold, self.bands, self.rows) # 임계값에 딱 걸친 쌍을 후보로 잡을 확률
+        self.shingle_size = shingle_size
+
+        # 해시 순열 (a*x + b) mod p - 같은 seed면 실행마다 같은 서명
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._buckets = [{} for _ in range(bands)] # 구간 값 -> 키 리스트
+        self._signatures = {}                       # 키 -> 서명
+        self._representative = {}                   # 키 -> 대표 키
+
+    def _shingles(self, text):
+        text = "".join(normalize_text(text).lower().split()) # 공백 차이는 무시
+        n = self.shingle_size
+        if len(text) <= n:
+            return {text} if text else set()
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def signature(self, text):
+        """MinHash 서명 (num_perm개 정수 배열)"""
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+        # 곱셈이 uint64 범위를 넘으면 2^64로 나눈 나머지가 되지만, 값을 고르게 섞는 용도라 문제없음
+        with np.errstate(over='ignore'):
+            permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return (permuted & np.uint64(_MAX_HASH)).min(axis=1)
+
+    def similarity(self, sig1, sig2):
+        """두 서명의 추정 Jaccard 유사도"""
+        return float(np.count_nonzero(sig1 == sig2)) / self.num_perm
+
+    def _band_keys(self, sig):
+        for band in range(self.bands):
+            yield band, sig[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key, text):
+        """기사 추가 -> 대표 키 반환 (비슷한 기사가 없으면 자기 자신)"""
+        sig = self.signature(text)
+        if sig is None:
+            self._representative[key] = key
+            return key
+
+        # 후보 중 가장 비슷한 기사 찾기
+        best_key, best_score = None, self.threshold
+        candidates = set()
+        for band, band_key in self._band_keys(sig):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        for candidate in candidates:
+            score = self.similarity(sig, self._signatures[candidate])
+            if score >= best_score:
+                best_key, best_score = candidate, score
+
+        representative = self._representative[best_key] if best_key is not None else key
+        self._representative[key] = representative
+        self._signatures[key] = sig
+        for band, band_key in self._band_keys(sig):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return representative
+
+
+def cluster_articles(articles, threshold=0.5):
+    """
+    articles: [(키, 제목, 내용), ...]
+    반환: 같은 순서의 대표 키 리스트 (대표 기사는 자기 키)
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    return [index.add(key, f"{title}\n{content}") for key, title, content in articles]
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+번역 결과 서버 전송 (번역 및 서버 저장.py에서 사용)
+
+- 전송할 결과는 먼저 SQLite 보낼편지함(outbox)에 저장하고, 백그라운드 스레드가 모아서 전송
+  -> 전송에 실패하거나 프로그램이 중간에 꺼져도 결과가 남아 있다가 나중에(다음 실행 포함) 다시 보냄
+- 연결을 재사용하는 requests.Session으로 전송 (기사마다 새 연결을 열지 않음)
+- bulk_url이 있으면 여러 건을 한 번의 요청({"items": [...]})으로, 없으면 한 건씩 여러 요청을 동시에 전송
+- 본문이 gzip_min_bytes 이상이면 gzip으로 압축 (압축한 요청이 4xx로 거부되면 압축 없이 한 번 더 보내고,
+  그게 성공하면 서버가 gzip을 풀지 못하는 것으로 보고 그 뒤로는 압축 없이 전송.
+  압축한 요청이 한 번이라도 성공했으면 gzip은 되는 것이므로 4xx에 압축 없이 다시 보내지 않음)
+- 일시적인 실패(연결 오류, 408/429/5xx)는 지수 백오프로 다시 보내고, 그 외 4xx는 실패로 남겨 둠
+"""
+
+import gzip
+import json
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 다시 보내면 성공할 수 있는 응답 코드 (연결 오류도 재시도)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class ResultSender:
+    """
+    sender = ResultSender(POST_URL, "results_outbox.db")
+    sender.submit(payload)  # 바로 반환 (보낼편지함에 저장 후 백그라운드 전송)
+    sender.flush()          # 남은 결과 전송 (끝까지 실패한 결과는 보낼편지함에 남음)
+    sender.close()
+    """
+
+    def __init__(self, post_url, outbox_path, bulk_url=None, batch_size=20, flush_interval=1.0,
+                 concurrency=4, use_gzip=True, gzip_min_bytes=1024, timeout=30,
+                 max_attempts=10, backoff_base=2.0, backoff_max=300.0):
+        self.post_url = post_url
+        self.bulk_url = bulk_url
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.use_gzip = use_gzip
+        self.gzip_min_bytes = gzip_min_bytes
+        self.gzip_confirmed = False # 압축한 요청이 성공한 적 있음 (4xx는 gzip 문제가 아님)
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sent = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        self._lock = threading.Lock()      # DB 연결 보호
+        self._send_lock = threading.Lock() # 같은 결과를 두 스레드가 동시에 보내지 않도록
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._new = 0
+
+        self.conn = sqlite3.connect(outbox_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                article_id TEXT,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT
+            )
+        """)
+        # 이전 실행에서 보내지 못한 결과는 바로 다시 시도
+        self.conn.execute("UPDATE outbox SET next_attempt_at = 0 WHERE status = 'pending'")
+        self.conn.commit()
+        leftover = self.pending_count()
+        if leftover:
+            print(f"📮 이전 실행에서 보내지 못한 결과 {leftover}건을 다시 전송합니다.")
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ---------- 보낼편지함 ----------
+
+    def submit(self, payload):
+        """결과 하나를 보낼편지함에 저장 (전송은 백그라운드에서)"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO outbox (article_id, payload, created_at) VALUES (?, ?, ?)",
+                (str(payload.get("articleId")), json.dumps(payload, ensure_ascii=False), now)
+            )
+            self._new += 1
+            if self._new >= self.batch_size:
+                self._wakeup.set()
+
+    def pending_count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    def failed_count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'failed'").fetchone()[0]
+
+    def undelivered_count(self):
+        """서버에 도착하지 않은 결과 수 (재시도 대기 + 실패, 서버에서는 아직 번역 전으로 남아 있음)"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox WHERE status IN ('pending', 'failed')").fetchone()[0]
+
+    def pending_article_ids(self):
+        """아직 서버에 도착하지 않은 결과의 articleId 집합 (이미 번역했으니 다시 번역할 필요 없음)"""
+        with self._lock:
+            rows = self.conn.execute("SELECT article_id FROM outbox WHERE status = 'pending'").fetchall()
+        return {row[0] for row in rows}
+
+    def _due_rows(self):
+        with self._lock:
+            return self.conn.execute(
+                "SELECT id, payload, attempts FROM outbox WHERE status = 'pending' AND next_attempt_at <= ? "
+                "ORDER BY id LIMIT ?",
+                (time.time(), self.batch_size)
+            ).fetchall()
+
+    def _next_attempt_at(self):
+        with self._lock:
+            return self.conn.execute("SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    # ---------- 전송 ----------
+
+    def _post(self, url, body, allow_gzip=True):
+        """JSON 문자열 전송 -> (응답 코드 또는 None, 오류 메시지)"""
+        data = body.encode('utf-8')
+        headers = {"Content-Type": "application/json"}
+        compressed = allow_gzip and self.use_gzip and len(data) >= self.gzip_min_bytes
+        if compressed:
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            res = self.session.post(url, data=data, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            return None, f"{type(e).__name__}: {e}"
+        if (compressed and not self.gzip_confirmed
+                and 400 <= res.status_code < 500 and res.status_code not in RETRYABLE_STATUS):
+            # gzip을 풀지 못하는 서버는 415 대신 JSON 파싱 실패(400)로 답하는 경우가 많으므로 압축 없이 한 번 더
+            status, error = self._post(url, body, allow_gzip=False)
+            if not error and self.use_gzip:
+                print(f"   .. 서버가 gzip 요청을 받지 않아 (HTTP {res.status_code}) 압축 없이 전송합니다.")
+                self.use_gzip = False
+            return status, error
+        if 200 <= res.status_code < 300:
+            if compressed:
+                self.gzip_confirmed = True
+            return res.status_code, ""
+        return res.status_code, f"HTTP {res.status_code}"
+
+    def _send_batch(self, rows):
+        """rows: [(id, payload, attempts), ...] -> [(id, attempts, 응답 코드, 오류), ...]"""
+        if self.bulk_url:
+            body = '{"items": [' + ",".join(payload for _, payload, _ in rows) + ']}'
+            status, error = self._post(self.bulk_url, body)
+            return [(row_id, attempts, status, error) for row_id, _, attempts in rows]
+        statuses = self._executor.map(lambda row: self._post(self.post_url, row[1]), rows)
+        return [(row_id, attempts, status, error) for (row_id, _, attempts), (status, error) in zip(rows, statuses)]
+
+    def _record(self, results):
+        now = time.time()
+        with self._lock, self.conn:
+            for row_id, attempts, status, error in results:
+                if not error:
+                    self.conn.execute("DELETE FROM outbox WHERE id = ?", (row_id,))
+                    self.sent += 1
+                    continue
+                attempts += 1
+                if (status is None or status in RETRYABLE_STATUS) and attempts < self.max_attempts:
+                    delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempts)))
+                    self.conn.execute(
+                        "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                        (attempts, now + delay, error, row_id)
+                    )
+                    print(f"   ㄴ ⚠️ 서버 전송 실패 ({error}), {delay:.0f}초 후 다시 전송 ({attempts}/{self.max_attempts})")
+                else:
+                    self.conn.execute(
+                        "UPDATE outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                        (attempts, error, row_id)
+                    )
+                    print(f"   ㄴ ❌ 서버 전송 실패: {error} (보낼편지함에 실패로 남겨 둠)")
+
+    def _send_due(self):
+        """지금 보낼 수 있는 결과를 batch_size개씩 모두 전송"""
+        with self._send_lock:
+            while True:
+                rows = self._due_rows()
+                if not rows:
+                    return
+                self._record(self._send_batch(rows))
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            with self._lock:
+                self._new = 0
+            try:
+                self._send_due()
+            except Exception as e:
+                print(f"❌ 결과 전송 스레드 오류: {e}")
+
+    def flush(self, timeout=60):
+        """
+        보낼편지함의 결과를 지금 모두 전송 (재시도 대기 중인 결과는 timeout초 안이면 기다렸다가 전송)
+        반환: 그래도 남은 결과 수 (다음 실행 때 다시 전송)
+        """
+        deadline = time.time() + timeout
+        while True:
+            self._send_due()
+            next_at = self._next_attempt_at()
+            if next_at is None or next_at > deadline:
+                return self.pending_count()
+            time.sleep(max(0.0, next_at - time.time()))
+
+    def summary(self):
+        return f"서버 전송 성공 {self.sent}건, 재시도 대기 {self.pending_count()}건, 실패 {self.failed_count()}건"
+
+    def close(self):
+        """백그라운드 전송을 멈추고 연결 정리 (보내지 못한 결과는 보낼편지함에 남아 다음 실행 때 전송)"""
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._executor.shutdown()
+        self.session.close()
+        self.conn.close()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+이미 수집한 기사 기록 (SQLite)
+
+- 링크와 본문 해시를 저장해 두고, 다음 실행 때 본문 수집 전에 걸러냄
+- 링크/해시 모두 인덱스가 있어 수만 건이 쌓여도 조회가 빠름
+"""
+
+import sqlite3
+from datetime import datetime
+
+
+class SeenStore:
+    """수집 완료 기사 저장소"""
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                link TEXT PRIMARY KEY,
+                content_hash TEXT,
+                collected_at TEXT
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_content_hash ON seen_articles(content_hash)")
+        self.conn.commit()
+
+    def has_link(self, link):
+        """이미 수집한 링크인지"""
+        row = self.conn.execute("SELECT 1 FROM seen_articles WHERE link = ?", (link,)).fetchone()
+        return row is not None
+
+    def has_content(self, content_hash):
+        """같은 본문을 이미 수집했는지 (링크만 다른 같은 기사)"""
+        if not content_hash:
+            return False
+        row = self.conn.execute("SELECT 1 FROM seen_articles WHERE content_hash = ? LIMIT 1", (content_hash,)).fetchone()
+        return row is not None
+
+    def add_many(self, records):
+        """records: [(링크, 본문 해시), ...] 를 한 트랜잭션으로 저장"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles (link, content_hash, collected_at) VALUES (?, ?, ?)",
+                [(link, content_hash, now) for link, content_hash in records]
+            )
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+긴 본문을 번역 요청 단위로 나누기 (번역 및 서버 저장.py에서 사용)
+
+- 문단(줄바꿈) 단위로 나누고, max_chars를 넘지 않게 앞에서부터 묶음
+- 한 문단이 max_chars보다 길면 문장 끝(。！？.!?؟)에서 나누고, 그래도 길면 글자 수로 자름
+- 나눈 순서대로 번역해서 빈 줄로 이어 붙이면 원문 문단 구성이 유지됨
+"""
+
+import re
+
+# 문장 하나 = 문장 끝 기호(일본어/중국어 。！？, 영어 .!?, 아랍어 ؟)와 뒤따르는 공백까지
+# (공백을 문장에 붙여 두어야 다시 이어 붙였을 때 "sentence one.This is"처럼 붙지 않음)
+SENTENCE = re.compile(r'.+?(?:[。．！？!?؟.]+\s*|$)', re.DOTALL)
+
+
+def split_paragraphs(text):
+    """빈 줄/줄바꿈 기준 문단 리스트 (빈 문단 제외)"""
+    return [p.strip() for p in str(text).splitlines() if p.strip()]
+
+
+def _split_long_paragraph(paragraph, max_chars):
+    """max_chars보다 긴 문단 -> 문장 단위 조각들"""
+    pieces, current = [], ""
+    for sentence in SENTENCE.findall(paragraph):
+        while len(sentence) > max_chars: # 문장 하나가 너무 길면 글자 수로 자름
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_units(text, max_chars=1500):
+    """본문 -> 번역 단위 리스트 (문단, 너무 긴 문단은 max_chars 이하 조각으로)"""
+    units = []
+    for paragraph in split_paragraphs(text):
+        if len(paragraph) <= max_chars:
+            units.append(paragraph)
+        else:
+            units.extend(_split_long_paragraph(paragraph, max_chars))
+    return units
+
+
+def pack_units(units, max_chars=1500):
+    """번역 단위들을 순서대로 max_chars 이하 묶음으로 -> [[단위, ...], ...]"""
+    groups, current = [], []
+    current_len = 0
+    for unit in units:
+        if current and current_len + len(unit) > max_chars:
+            groups.append(current)
+            current, current_len = [], 0
+        current.append(unit)
+        current_len += len(unit)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def chunk_text(text, max_chars=1500):
+    """본문 -> max_chars 이하 조각 리스트 (조각 안의 문단은 빈 줄로 구분)"""
+    return ["\n\n".join(group) for group in pack_units(split_units(text, max_chars), max_chars)]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 필터 (제외 키워드, 스팸 키워드, 쓰레기 문구 검사용)
+
+- 키워드 목록을 트라이(trie) 형태의 정규식 하나로 미리 컴파일
+- 문자열마다 키워드 수만큼 반복하는 대신 한 번의 탐색으로 검사
+- 키워드가 수백 개로 늘어나도 검사 비용이 거의 늘지 않음
+"""
+
+import re
+
+
+def build_trie_pattern(keywords):
+    """키워드 목록 -> 공통 접두사를 묶은 정규식 문자열"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = True # 키워드 끝 표시
+
+    def build(node):
+        is_end = '' in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != '']
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        body = '(?:' + '|'.join(branches) + ')'
+        return body + '?' if is_end else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """키워드 중 하나라도 포함되어 있는지 한 번에 검사"""
+
+    def __init__(self, keywords):
+        self.keywords = [k for k in dict.fromkeys(keywords) if k] # 중복/빈 문자열 제거, 순서 유지
+        self._regex = re.compile(build_trie_pattern(self.keywords)) if self.keywords else None
+
+    def search(self, text):
+        """처음 발견된 키워드 반환 (없으면 None)"""
+        if self._regex is None or not text:
+            return None
+        match = self._regex.search(text)
+        return match.group(0) if match else None
+
+    def __repr__(self):
+        return f"KeywordMatcher({len(self.keywords)}개 키워드)"
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+문단 단위 번역 메모리 (SQLite)
+
+- 원문 문단을 정규화(content_hash.normalize_text)한 SHA-256 + 번역 언어를 키로 번역문 저장
+- 언론사 공통 문구, 면책 문구, 같은 기사의 수정본처럼 이미 번역한 문단은 다시 요청하지 않음
+- 번역 작업 스레드 여러 개에서 함께 사용하므로 연결 하나를 잠금으로 보호
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+
+from content_hash import normalize_text
+
+
+def paragraph_key(paragraph):
+    return hashlib.sha256(normalize_text(paragraph).encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """원문 문단 -> 번역문 저장소"""
+
+    def __init__(self, db_path, model_name=""):
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                source_hash TEXT NOT NULL,
+                language TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                model_name TEXT,
+                created_at TEXT,
+                PRIMARY KEY (source_hash, language)
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, paragraphs, language):
+        """저장된 번역이 있는 문단만 {원문 문단: 번역문}으로 반환"""
+        keys = {}
+        for p in paragraphs:
+            keys.setdefault(paragraph_key(p), []).append(p) # 공백만 다른 문단은 같은 키
+        found = {}
+        with self._lock:
+            key_list = list(keys)
+            for i in range(0, len(key_list), 500): # SQLite 변수 개수 제한
+                part = key_list[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT source_hash, translation FROM translation_memory "
+                    f"WHERE language = ? AND source_hash IN ({','.join('?' * len(part))})",
+                    [language] + part
+                ).fetchall()
+                for source_hash, translation in rows:
+                    for p in keys[source_hash]:
+                        found[p] = translation
+            self.hits += len(found)
+            self.misses += len(set(paragraphs)) - len(found)
+        return found
+
+    def put_many(self, pairs, language):
+        """pairs: [(원문 문단, 번역문), ...]"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(paragraph_key(p), language, t, self.model_name, now) for p, t in pairs if p and t]
+        if not rows:
+            return
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translation_memory "
+                "(source_hash, language, translation, model_name, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def summary(self):
+        total = self.hits + self.misses
+        return f"번역 메모리 적중 {self.hits}/{total}문단"
+
+    def close(self):
+        self.conn.close()
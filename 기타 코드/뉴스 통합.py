@@ -1,18 +1,21 @@
 import pandas as pd
 import feedparser
 import os
+import sys
 import re
 import json
 import time
-import hashlib
 import requests
-import unicodedata
 import google.generativeai as genai
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from bs4 import BeautifulSoup
 from newspaper import Article, Config
 
+# contentHash는 상위 폴더의 공통 모듈로 계산 (모든 스크립트에서 같은 해시가 나오도록)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from content_hash import compute_content_hash
+
 # ==========================================
 # [사용자 설정] 환경에 맞게 수정하세요
 # ==========================================
@@ -52,20 +55,6 @@ def clean_html(raw_html):
     cleanr = re.compile('<.*?>')
     return re.sub(cleanr, '', raw_html).strip()
 
-def normalize_text(text: str) -> str:
-    """텍스트 정규화 (해시용)"""
-    if not text: return ""
-    text = str(text)
-    text = unicodedata.normalize("NFKC", text)
-    text = text.strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
-
-def compute_content_hash(title: str, content: str) -> str:
-    """SHA-256 해시 생성"""
-    payload = f"{normalize_text(title)}\n{normalize_text(content)}"
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
 def normalize_date(date_str):
     """
     날짜를 ISO 8601 형식(YYYY-MM-DDTHH:mm:ss+HH:MM)으로 통일
@@ -8,6 +8,11 @@ from datetime import datetime
 from dateutil import parser as date_parser
 from bs4 import BeautifulSoup
 import os
+import sys
+
+# contentHash는 상위 폴더의 공통 모듈로 계산 (모든 스크립트에서 같은 해시가 나오도록)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from content_hash import compute_content_hash
 
 # ==============================================================================
 # [설정] 사용자 환경 설정
@@ -130,6 +135,7 @@ def phase1_collect_news():
                     "title": title,
                     "content": content,
                     "publishedAt": normalize_date(entry.get('published', '')),
+                    "contentHash": compute_content_hash(title, content), # 서버 버전과 같은 해시
                 }
                 collected_articles.append(article_obj)
         except Exception as e:
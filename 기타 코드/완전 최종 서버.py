@@ -3,12 +3,18 @@ import feedparser
 import requests
 import json
 import time
-import hashlib
 import google.generativeai as genai
 from datetime import datetime
 from dateutil import parser as date_parser
 from bs4 import BeautifulSoup
 import os
+import sys
+
+# contentHash는 상위 폴더의 공통 모듈로 계산 (모든 스크립트에서 같은 해시가 나오도록)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from content_hash import compute_content_hash
+from llm_client import LLMClient
+from bulk_ingest import BulkIngestClient
 
 # ==============================================================================
 # [설정] 사용자 환경 설정
@@ -26,11 +32,19 @@ SERVER_HOST = "http://localhost:8080"
 URL_INGEST = f"{SERVER_HOST}/api/admin/ingestion/articles:bulk"      # 원본 저장용
 URL_PULL   = f"{SERVER_HOST}/api/llm/pull?languageTarget=ko&limit=10" # 번역 대상 가져오기용
 URL_RESULT = f"{SERVER_HOST}/api/llm/results"                         # 번역 결과 저장용
+FILE_INGEST_FAILED_JSON = "1_original_news_failed.json" # 서버 저장에 실패한 원본 기사 (bulk_ingest.py로 다시 전송)
 
 # 4. Gemini 모델 설정
 genai.configure(api_key=GEMINI_API_KEY)
 model = genai.GenerativeModel('gemini-2.0-flash')
 
+# 5. AI 요청 한도 (분당 요청 수/토큰 수, 동시에 번역할 최대 기사 수)
+LLM_RPM = 15
+LLM_TPM = 1000000
+LLM_MAX_CONCURRENCY = 4
+LLM_REQUEUE_ROUNDS = 2 # 번역에 실패한 기사를 모아서 다시 시도할 횟수
+llm = LLMClient(model.generate_content, rpm=LLM_RPM, tpm=LLM_TPM, max_concurrency=LLM_MAX_CONCURRENCY, max_output_tokens=4096)
+
 # ==============================================================================
 # [Helper Functions] 데이터 가공용 함수들
 # ==============================================================================
@@ -41,11 +55,6 @@ def clean_html(raw_html):
     soup = BeautifulSoup(raw_html, "html.parser")
     return soup.get_text(strip=True)
 
-def compute_hash(title, content):
-    """중복 방지를 위한 Content Hash 생성 (SHA-256)"""
-    text = (str(title) + str(content)).encode('utf-8')
-    return hashlib.sha256(text).hexdigest()
-
 def normalize_date(date_str):
     """날짜 형식을 서버가 좋아하는 ISO 8601 포맷으로 통일"""
     if not date_str:
@@ -87,10 +96,11 @@ def get_ai_translation(title, content):
     {{ "translatedTitle": "...", "translatedContent": "...", "summaryText": "..." }}
     """
     try:
-        response = model.generate_content(prompt)
+        response = llm.generate(prompt)
         text = response.text.replace("```json", "").replace("```", "").strip()
         return json.loads(text)
-    except:
+    except Exception as e:
+        print(f"      ⚠️ AI 처리 오류: {e}")
         return None
 
 # ==============================================================================
@@ -139,7 +149,7 @@ def phase1_collect_and_ingest():
                     "title": title,
                     "content": content,
                     "publishedAt": normalize_date(entry.get('published', '')), # 날짜 수정
-                    "contentHash": compute_hash(title, content) # 해시 생성
+                    "contentHash": compute_content_hash(title, content) # 해시 생성
                 }
                 collected_articles.append(article_obj)
         except Exception as e:
@@ -151,19 +161,20 @@ def phase1_collect_and_ingest():
         json.dump(payload, f, ensure_ascii=False, indent=2)
     print(f"✅ [저장 1] 원본 파일 생성 완료: {FILE_ORIGINAL_JSON}")
 
-    # 4. 서버로 전송 (Ingest)
+    # 4. 서버로 전송 (Ingest) - 조각으로 나눠 압축해서 동시에 전송, 실패한 조각만 따로 남김
     print("🚀 서버로 원본 데이터 전송 중...")
-    try:
-        res = requests.post(URL_INGEST, json=payload)
-        if res.status_code == 200:
-            print("✅ 서버 Ingest 성공!")
-            return True
-        else:
-            print(f"❌ 서버 Ingest 실패: {res.status_code} - {res.text}")
-            return False
-    except Exception as e:
-        print(f"❌ 서버 연결 실패: {e}")
-        return False
+    client = BulkIngestClient(URL_INGEST)
+    results = client.ingest(collected_articles)
+    client.close()
+    print(f"📊 {client.summary(results)}")
+
+    failed = client.failed_articles(collected_articles, results)
+    if failed:
+        with open(FILE_INGEST_FAILED_JSON, 'w', encoding='utf-8') as f:
+            json.dump({"articles": failed}, f, ensure_ascii=False, indent=2)
+        print(f"⚠️ 저장 실패 {len(failed)}건 -> {FILE_INGEST_FAILED_JSON} (python bulk_ingest.py {FILE_INGEST_FAILED_JSON} 로 다시 전송)")
+    # 일부라도 저장됐으면 번역 단계 진행
+    return len(failed) < len(collected_articles)
 
 # ==============================================================================
 # [Phase 2] 서버 조회(Pull) -> AI 번역 -> JSON 저장 -> 서버 전송 (Result)
@@ -191,12 +202,13 @@ def phase2_pull_translate_result():
     
     translated_results = []
 
-    # 2. AI 번역 loop
-    for idx, item in enumerate(items):
+    # 2. AI 번역 (요청 한도 안에서 여러 기사를 동시에 번역)
+    ai_results = llm.map(lambda item: get_ai_translation(item.get("title"), item.get("content")), items,
+                         requeue_rounds=LLM_REQUEUE_ROUNDS)
+
+    for idx, (item, ai_data) in enumerate(zip(items, ai_results)):
         article_id = item.get("articleId") # 서버가 부여한 ID (필수)
-        print(f"   ▶ [{idx+1}/{len(items)}] 번역 중... (ID: {article_id})")
-        
-        ai_data = get_ai_translation(item.get("title"), item.get("content"))
+        print(f"   ▶ [{idx+1}/{len(items)}] 번역 결과 처리 중... (ID: {article_id})")
         
         if ai_data:
             # 3. 결과 데이터 구성 (Result 포맷 준수)
@@ -222,9 +234,7 @@ def phase2_pull_translate_result():
             except Exception as e:
                 print(f"      ❌ 전송 오류: {e}")
         else:
-            print("      ⚠️ AI 응답 실패")
-        
-        time.sleep(1) # API 과부하 방지
+            print("      ⚠️ AI 응답 실패 (다음 실행 때 다시 가져와 번역)")
 
     # 5. 번역된 파일 저장
     with open(FILE_TRANSLATED_JSON, 'w', encoding='utf-8') as f:
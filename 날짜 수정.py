@@ -1,59 +1,35 @@
-import json
 import os
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+
+# 날짜 정리 함수는 csv2json.py와 공통 (csv2json.py로 새로 만든 파일은 이미 날짜가 정리되어 있음)
+from article_stream import ArticleWriter, fix_date_format, read_articles
 
 # ==========================================
 # 파일 경로 설정
 # ==========================================
 INPUT_FILE = 'japanese_news.json'
 OUTPUT_FILE = 'japanese_news_fixed.json'
+# 출력 형식: 'json' = {"articles": [...]} (한 줄) / 'ndjson' = 한 줄에 기사 하나
+# 입력이 .ndjson/.jsonl이면 한 줄씩 읽어 큰 파일도 메모리 일정
+OUTPUT_FORMAT = 'json'
 # ==========================================
 
-def fix_date_format(date_str):
-    if not date_str:
-        return datetime.now().astimezone().isoformat()
-    
-    # 1. RFC 1123 형식 처리 (예: Fri, 19 Dec 2025 16:50:00 +0900)
-    if ',' in date_str:
-        try:
-            dt = parsedate_to_datetime(date_str)
-            return dt.isoformat()
-        except:
-            pass
-
-    # 2. 일반 공백 형식 처리 (예: 2025-12-19 16:31:35) -> 이번 에러의 원인
-    if ' ' in date_str and 'T' not in date_str:
-        try:
-            # 공백을 T로 바꾸고 기본 시간대(+09:00)를 붙여줌
-            clean_date = date_str.replace(' ', 'T')
-            if '+' not in clean_date and 'Z' not in clean_date:
-                clean_date += "+09:00"
-            return clean_date
-        except:
-            pass
-
-    # 3. 이미 올바른 형식인 경우 또는 기타
-    return date_str
-
 def main():
     if not os.path.exists(INPUT_FILE):
         print(f"파일을 찾을 수 없습니다: {INPUT_FILE}")
         return
 
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    if 'articles' in data:
-        for article in data['articles']:
+    # articles 외의 최상위 키도 그대로 유지 (json 형식일 때)
+    metadata = {}
+    with ArticleWriter(OUTPUT_FILE, OUTPUT_FORMAT, metadata=metadata) as writer:
+        for article in read_articles(INPUT_FILE, metadata=metadata):
             old_date = article.get('publishedAt', '')
             new_date = fix_date_format(old_date)
             article['publishedAt'] = new_date
-            
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+            writer.write(article)
 
-    print(f"✅ 변환 완료: {OUTPUT_FILE}")
+    print(f"✅ 변환 완료: {OUTPUT_FILE} ({writer.count}건)")
+    if metadata and OUTPUT_FORMAT != 'json':
+        print(f"⚠️ {OUTPUT_FORMAT} 형식에는 articles 외의 최상위 키({', '.join(metadata)})를 담을 수 없어 저장하지 않았습니다.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,15 @@
 import requests
 import json
-import google.generativeai as genai
+import re
 import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import google.generativeai as genai
+
+from llm_client import LLMClient, estimate_tokens
+from text_chunker import split_units, pack_units
+from translation_memory import TranslationMemory
+from result_sender import ResultSender
 
 # ==========================================
 # [설정] 새로 발급받은 본인의 API 키를 입력하세요
@@ -10,20 +18,59 @@ GEMINI_API_KEY = ""
 
 # 서버 주소
 SERVER_HOST = "http://localhost:8080"
-GET_URL = f"{SERVER_HOST}/api/llm/pull?languageTarget=ko&limit=10"
+TARGET_LANGUAGE = "ko"
+PULL_LIMIT = 10 # 한 번에 가져올 기사 수
+GET_URL = f"{SERVER_HOST}/api/llm/pull"
 POST_URL = f"{SERVER_HOST}/api/llm/results"
+HTTP_TIMEOUT = 30 # 서버 요청 제한 시간(초)
+
+# 결과 전송 - 보낼편지함(SQLite)에 먼저 저장한 뒤 모아서 전송, 실패한 결과는 나중에(다음 실행 포함) 다시 보냄
+RESULTS_BULK_URL = None # 여러 건을 한 번에 받는 API가 있으면 주소 입력 (없으면 한 건씩 동시에 전송)
+RESULTS_OUTBOX_FILENAME = "results_outbox.db"
+RESULTS_BATCH_SIZE = 20 # 한 번에 모아서 보낼 결과 수
+RESULTS_GZIP = True     # 큰 요청 본문 gzip 압축 (서버가 압축한 요청을 4xx로 거부하면 자동으로 압축 없이 전송)
 
 # 로컬에 저장할 파일명
 OUTPUT_FILENAME = "ai_processed_results.json"
 
+# AI 요청 한도 (사용 중인 Gemini 요금제의 분당 요청 수/토큰 수에 맞게 설정)
+LLM_RPM = 15
+LLM_TPM = 1000000
+LLM_MAX_CONCURRENCY = 4 # 동시에 번역할 최대 기사 수
+LLM_REQUEUE_ROUNDS = 2  # 번역에 실패한 기사를 모아서 다시 시도할 횟수
+
+# 긴 기사 나눠 번역 (이 길이를 넘는 본문은 문단 단위 조각으로 나눠 동시에 번역하고, 요약은 따로 요청)
+SINGLE_REQUEST_CHARS = 2000 # 이하이면 기존처럼 한 번의 요청으로 제목/본문/요약 처리
+CHUNK_CHARS = 1500          # 조각 하나의 최대 글자 수
+SUMMARY_SOURCE_CHARS = 6000 # 요약/제목 번역 요청에 넣을 본문 앞부분 길이
+
+# 작업자 모드 (python "번역 및 서버 저장.py" --worker)
+# 종료할 때까지 계속 pull -> 번역 -> 전송. 번역 중에 다음 pull을 미리 받아 두고, 끝난 기사는 바로 전송
+WORKER_MAX_IN_FLIGHT = 20 # 번역 대기/진행 중인 기사 수 상한 (이보다 적을 때만 다음 pull)
+WORKER_IDLE_SECONDS = 30  # 가져올 기사가 없을 때 다음 pull까지 대기 시간(초)
+WORKER_MAX_ATTEMPTS = 3   # 같은 기사가 이 횟수만큼 번역에 실패하면 이번 실행에서는 건너뜀
+WORKER_MAX_PULL_LIMIT = 200 # 진행 중/전송 전/건너뛴 기사만큼 pull 개수를 늘려 그 뒤의 기사를 받을 때의 상한
+
+# 문단 단위 번역 메모리 (이미 번역한 문단은 다시 요청하지 않음)
+USE_TRANSLATION_MEMORY = True
+TRANSLATION_MEMORY_FILENAME = "translation_memory.db"
+
 # Gemini 모델 설정
 genai.configure(api_key=GEMINI_API_KEY)
 model = genai.GenerativeModel('gemini-2.0-flash')
+# 본문 전체 번역이라 응답 토큰을 넉넉하게 잡음 (실제 사용량은 응답 후 보정)
+llm = LLMClient(model.generate_content, rpm=LLM_RPM, tpm=LLM_TPM, max_concurrency=LLM_MAX_CONCURRENCY, max_output_tokens=4096)
+memory = TranslationMemory(TRANSLATION_MEMORY_FILENAME, model_name="gemini-2.0-flash") if USE_TRANSLATION_MEMORY else None
 # ==========================================
 
-def get_ai_result(title, content):
+def parse_ai_json(response_text):
+    """AI 응답 -> dict (혹시 모를 마크다운 제거)"""
+    clean_text = response_text.replace("```json", "").replace("```", "").strip()
+    return json.loads(clean_text)
+
+def translate_whole(title, content):
     """
-    Gemini에게 제목번역, 전체번역, 요약을 요청하고 JSON으로 받습니다.
+    Gemini에게 제목번역, 전체번역, 요약을 요청하고 JSON으로 받습니다. (짧은 기사용)
     """
     prompt = f"""
     당신은 전문 번역가이자 뉴스 에디터입니다. 아래 내용을 요청에 맞게 처리해주세요.
@@ -48,79 +95,335 @@ def get_ai_result(title, content):
     }}
     """
     try:
-        response = model.generate_content(prompt)
-        # 혹시 모를 마크다운 제거
-        clean_text = response.text.replace("```json", "").replace("```", "").strip()
-        return json.loads(clean_text)
+        response = llm.generate(prompt)
+        return parse_ai_json(response.text)
     except Exception as e:
         print(f"⚠️ AI 처리 오류: {e}")
         return None
 
-def main():
-    # 1. 서버에서 원본 뉴스 가져오기 (GET)
-    print("📡 [1단계] 뉴스 데이터 가져오는 중...")
+def translate_title_and_summary(title, content):
+    """긴 기사의 제목 번역 + 요약 (본문 번역과 따로 요청, 응답이 짧아 JSON이 잘리지 않음)"""
+    prompt = f"""
+    당신은 전문 번역가이자 뉴스 에디터입니다. 아래 내용을 요청에 맞게 처리해주세요.
+
+    [원문 제목]
+    {title}
+
+    [원문 내용]
+    {content[:SUMMARY_SOURCE_CHARS]}
+
+    [요청사항]
+    1. 제목을 한국어로 자연스럽게 번역하세요. (translatedTitle)
+    2. 내용을 한국어로 3줄 이내로 핵심 요약하세요. (summaryText)
+
+    [출력 포맷]
+    반드시 아래 JSON 형식으로만 출력하세요 (마크다운 없이):
+    {{
+        "translatedTitle": "...",
+        "summaryText": "..."
+    }}
+    """
     try:
-        res = requests.get(GET_URL)
-        items = res.json().get("items", [])
-        if not items:
-            print("📭 가져올 뉴스가 없습니다. (DB가 비었거나 모두 처리됨)")
-            return
-        print(f"✅ 총 {len(items)}개의 뉴스를 가져왔습니다.")
+        response = llm.generate(prompt, estimated_tokens=estimate_tokens(prompt) + 512)
+        return parse_ai_json(response.text)
+    except Exception as e:
+        print(f"⚠️ AI 처리 오류 (제목/요약): {e}")
+        return None
+
+UNIT_MARKER = re.compile(r'^\s*\[\[(\d+)\]\]\s*', re.M)
+
+def translate_chunk(units):
+    """
+    본문 조각(문단 리스트) 번역 -> (문단별 번역문 리스트, 문단 대응 여부) / 실패하면 None
+    문단마다 [[번호]] 표시를 붙여 보내고, 응답도 같은 표시로 나눠 문단별 번역을 얻음
+    """
+    marked = "\n\n".join(f"[[{i}]] {unit}" for i, unit in enumerate(units, 1))
+    prompt = f"""
+    당신은 전문 번역가입니다. 아래는 뉴스 기사 본문의 일부입니다.
+    빠짐없이 한국어로 자연스럽게 번역하세요.
+    각 문단 앞의 [[번호]] 표시는 그대로 두고, 문단 순서와 개수를 바꾸지 마세요.
+    번역문만 출력하세요. 설명이나 마크다운은 넣지 마세요.
+
+    [원문]
+    {marked}
+    """
+    try:
+        # 번역문은 원문과 길이가 비슷하므로 응답 토큰도 원문 기준으로 예상
+        response = llm.generate(prompt, estimated_tokens=estimate_tokens(prompt) + estimate_tokens(marked) * 2)
+        text = response.text.strip()
+    except Exception as e:
+        print(f"⚠️ AI 처리 오류 (본문 조각): {e}")
+        return None
+
+    parts = UNIT_MARKER.split(text) # ['', '1', 번역1, '2', 번역2, ...]
+    numbers = parts[1::2]
+    if numbers == [str(i) for i in range(1, len(units) + 1)]:
+        return [part.strip() for part in parts[2::2]], True
+    # 표시가 빠지거나 어긋나면 조각 전체를 한 덩어리로 사용 (문단별로는 번역 메모리에 저장하지 않음)
+    return [UNIT_MARKER.sub("", text).strip()] + [""] * (len(units) - 1), False
+
+def translate_in_order(units):
+    """
+    번역 메모리 없이 문단 순서 그대로 조각을 나눠 번역 -> 본문 번역문 (실패하면 None)
+    조각이 원문에서 연속된 문단이라 [[번호]]가 어긋난 조각도 한 덩어리로 제자리에 들어감
+    """
+    groups = pack_units(units, CHUNK_CHARS)
+    chunk_results = llm.map(translate_chunk, groups)
+    if any(result is None for result in chunk_results):
+        return None
+    for group, (translated_units, aligned) in zip(groups, chunk_results):
+        if memory and aligned:
+            memory.put_many(zip(group, translated_units), TARGET_LANGUAGE)
+    return "\n\n".join(p for translated_units, _ in chunk_results for p in translated_units if p)
+
+def get_ai_result(title, content):
+    """
+    제목번역, 전체번역, 요약 결과를 dict로 반환 (실패하면 None)
+    - 번역 메모리에 있는 문단은 그대로 사용하고, 없는 문단만 번역 요청
+    - 번역할 문단은 조각으로 묶어 동시에 번역한 뒤 원래 순서대로 이어 붙이고, 요약은 따로 요청
+    """
+    content = str(content or "")
+    units = split_units(content, CHUNK_CHARS)
+    cached = memory.get_many(units, TARGET_LANGUAGE) if memory else {}
+
+    # 짧고 처음 보는 기사는 기존처럼 한 번에 처리 (요청 수 절약)
+    # 문단 대응을 확인할 수 없으므로 번역 메모리에는 저장하지 않음 ([[번호]]로 맞춘 번역만 저장)
+    if not cached and len(content) <= SINGLE_REQUEST_CHARS:
+        return translate_whole(title, content)
+
+    missing = [unit for unit in dict.fromkeys(units) if unit not in cached]
+    groups = pack_units(missing, CHUNK_CHARS)
+    tasks = [None] + groups # None: 제목/요약 요청
+    results = llm.map(lambda group: translate_title_and_summary(title, content) if group is None else translate_chunk(group), tasks)
+
+    meta, chunk_results = results[0], results[1:]
+    if not meta or any(result is None for result in chunk_results):
+        return None # 조각 하나라도 실패하면 기사 전체를 다시 시도 대상으로
+
+    # [[번호]]가 어긋난 조각은 문단별로 나눌 수 없음. 번역 메모리 문단이나 반복 문단이 사이에 끼어
+    # 조각이 원문에서 연속되지 않으면 제자리에 넣을 수 없으므로 메모리 없이 본문 전체를 다시 번역
+    if missing != units and not all(aligned for _, aligned in chunk_results):
+        print("⚠️ 문단 표시가 어긋나 번역 메모리 없이 본문 전체를 다시 번역합니다.")
+        translated_content = translate_in_order(units)
+        if translated_content is None:
+            return None
+        return {
+            "translatedTitle": meta.get("translatedTitle", ""),
+            "translatedContent": translated_content,
+            "summaryText": meta.get("summaryText", "")
+        }
+
+    translations = dict(cached)
+    for group, (translated_units, aligned) in zip(groups, chunk_results):
+        translations.update(zip(group, translated_units))
+        if memory and aligned:
+            memory.put_many(zip(group, translated_units), TARGET_LANGUAGE)
+
+    return {
+        "translatedTitle": meta.get("translatedTitle", ""),
+        "translatedContent": "\n\n".join(translations[unit] for unit in units if translations[unit]),
+        "summaryText": meta.get("summaryText", "")
+    }
+
+def fetch_items(limit=PULL_LIMIT):
+    """서버에서 번역할 원본 뉴스 가져오기 (실패하면 None)"""
+    try:
+        res = requests.get(GET_URL, params={"languageTarget": TARGET_LANGUAGE, "limit": limit}, timeout=HTTP_TIMEOUT)
+        return res.json().get("items", [])
     except Exception as e:
         print(f"❌ 서버 연결 실패 (GET): {e}")
+        return None
+
+def build_payload(article_id, ai_data):
+    return {
+        "articleId": article_id,
+        "languageTarget": TARGET_LANGUAGE,
+        "translatedTitle": ai_data["translatedTitle"],
+        "translatedContent": ai_data["translatedContent"],
+        "summaryText": ai_data["summaryText"],
+        "modelName": "gemini-2.0-flash"
+    }
+
+def create_sender():
+    return ResultSender(POST_URL, RESULTS_OUTBOX_FILENAME, bulk_url=RESULTS_BULK_URL, batch_size=RESULTS_BATCH_SIZE,
+                        use_gzip=RESULTS_GZIP, timeout=HTTP_TIMEOUT)
+
+def save_local(local_save_list):
+    """번역 결과를 로컬 JSON 파일로 저장"""
+    if not local_save_list:
+        print("\n⚠️ 저장할 데이터가 없습니다.")
+        return
+    print(f"\n💾 로컬 파일 저장 중... ({OUTPUT_FILENAME})")
+    try:
+        with open(OUTPUT_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(local_save_list, f, ensure_ascii=False, indent=2)
+        print("🎉 로컬 저장 완료!")
+    except Exception as e:
+        print(f"❌ 파일 저장 실패: {e}")
+
+def translate_item(item):
+    """작업자 모드용: 기사 하나 번역 (예외 없이 실패하면 None)"""
+    try:
+        llm.wait_until_available()
+        return get_ai_result(item.get("title"), item.get("content"))
+    except Exception as e:
+        print(f"⚠️ AI 처리 오류: {e}")
+        return None
+
+def run_worker():
+    """
+    작업자 모드: 종료(Ctrl+C)할 때까지 pull -> 번역 -> 전송을 계속 반복
+    - 번역 중에도 다음 pull을 미리 받아 두고, 대기/진행 중인 기사가 WORKER_MAX_IN_FLIGHT개를 넘지 않게 채움
+    - 기사 하나의 번역이 끝나면 다른 기사를 기다리지 않고 바로 전송 대기열(보낼편지함)에 넣음
+    - 번역에 실패한 기사는 결과를 보내지 않았으므로 다음 pull에서 다시 가져와 번역
+    - WORKER_MAX_ATTEMPTS번 실패한 기사는 건너뜀
+    - 서버는 끝나지 않은 기사를 오래된 순으로 계속 돌려주므로, 진행 중인 기사 + 결과가 아직 서버에 도착하지 않은 기사
+      (전송 대기/실패) + 건너뛴 기사 수만큼 pull 개수를 늘려 그 뒤의 새 기사를 받음
+      (이 기사들이 pull을 모두 차지해 미리 받기가 헛돌거나 멈추지 않도록)
+    """
+    print(f"🔁 작업자 모드 시작 (대기/진행 최대 {WORKER_MAX_IN_FLIGHT}건, 종료: Ctrl+C)")
+    translator = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY)
+    puller = ThreadPoolExecutor(max_workers=1)
+    sender = create_sender()
+    in_flight = {}   # future -> 기사
+    failures = {}    # articleId -> 번역 실패 횟수
+    given_up = set() # WORKER_MAX_ATTEMPTS번 실패해 이번 실행에서는 건너뛰는 기사
+    warned_pull_limit = False
+    sent_ids = sender.pending_article_ids() # 전송할 기사 (서버에 도착하기 전에 pull에 다시 섞여 와도 다시 번역하지 않음)
+    local_save_list = []
+    next_pull = None
+    idle_until = 0.0
+    wait_for_progress = False # pull에 진행 중인 기사만 있었으면 하나라도 끝난 뒤에 다시 pull
+
+    try:
+        while True:
+            # 1. 자리가 남아 있으면 다음 pull을 미리 시작 (번역과 동시에 진행)
+            if (next_pull is None and not wait_for_progress and time.monotonic() >= idle_until
+                    and len(in_flight) + PULL_LIMIT <= WORKER_MAX_IN_FLIGHT):
+                already_known = len(in_flight) + sender.undelivered_count() + len(given_up)
+                pull_limit = min(PULL_LIMIT + already_known, WORKER_MAX_PULL_LIMIT)
+                if PULL_LIMIT + already_known > WORKER_MAX_PULL_LIMIT and not warned_pull_limit:
+                    print(f"   ㄴ ⚠️ 진행 중/전송 전/건너뛴 기사가 {already_known}건이라 pull 개수 상한({WORKER_MAX_PULL_LIMIT})을 넘었습니다. "
+                          f"새 기사를 받지 못할 수 있으니 보낼편지함의 실패 결과와 번역 실패 원인을 확인하세요.")
+                warned_pull_limit = PULL_LIMIT + already_known > WORKER_MAX_PULL_LIMIT
+                next_pull = puller.submit(fetch_items, pull_limit)
+
+            waiting = list(in_flight) + ([next_pull] if next_pull else [])
+            if not waiting:
+                time.sleep(max(0.0, idle_until - time.monotonic()))
+                continue
+            done, _ = wait(waiting, timeout=max(1.0, idle_until - time.monotonic()), return_when=FIRST_COMPLETED)
+
+            # 2. pull 결과 -> 이미 진행 중/전송한/여러 번 실패한 기사를 빼고 번역 대기열에 추가
+            if next_pull in done:
+                items = next_pull.result() or []
+                next_pull = None
+                active = {item.get("articleId") for item in in_flight.values()}
+                new_items = [
+                    item for item in items
+                    if item.get("articleId") not in active
+                    and str(item.get("articleId")) not in sent_ids
+                    and item.get("articleId") not in given_up
+                ][:PULL_LIMIT]
+                for item in new_items:
+                    in_flight[translator.submit(translate_item, item)] = item
+                if new_items:
+                    idle_until = 0.0
+                    print(f"📡 {len(new_items)}건 추가 (대기/진행 중 {len(in_flight)}건)")
+                elif not in_flight:
+                    if not idle_until:
+                        print(f"📭 가져올 뉴스가 없습니다. {WORKER_IDLE_SECONDS}초마다 다시 확인합니다."
+                              + (f" (번역 실패로 건너뛴 기사 {len(given_up)}건)" if given_up else ""))
+                    idle_until = time.monotonic() + WORKER_IDLE_SECONDS
+                else:
+                    wait_for_progress = True
+
+            # 3. 끝난 번역은 바로 전송
+            for future in done:
+                item = in_flight.pop(future, None)
+                if item is None:
+                    continue
+                wait_for_progress = False
+                article_id = item.get("articleId")
+                ai_data = future.result()
+                print(f"▶ 번역 완료: {article_id}")
+                if not ai_data:
+                    failures[article_id] = failures.get(article_id, 0) + 1
+                    if failures[article_id] < WORKER_MAX_ATTEMPTS:
+                        print(f"   ㄴ ⚠️ AI 응답 실패 ({failures[article_id]}/{WORKER_MAX_ATTEMPTS}, 다음 pull에서 다시 시도)")
+                        continue
+                    given_up.add(article_id)
+                    print(f"   ㄴ ⚠️ AI 응답 실패 ({WORKER_MAX_ATTEMPTS}회), 이번 실행에서는 건너뜀 (다음 실행 때 다시 시도)")
+                    continue
+                payload = build_payload(article_id, ai_data)
+                local_save_list.append(payload)
+                sender.submit(payload)
+                if len(sent_ids) >= 100000:
+                    sent_ids.clear()
+                sent_ids.add(str(article_id))
+    except KeyboardInterrupt:
+        print(f"\n🛑 작업자 종료 (진행 중이던 {len(in_flight)}건은 다음 실행 때 다시 가져와 번역합니다)")
+    finally:
+        translator.shutdown(wait=False, cancel_futures=True)
+        puller.shutdown(wait=False)
+        print("📤 남은 결과 전송 중...")
+        sender.flush()
+        print(f"✅ {sender.summary()}")
+        sender.close()
+        if memory:
+            print(f"📚 {memory.summary()}")
+        save_local(local_save_list)
+
+def main():
+    # 1. 서버에서 원본 뉴스 가져오기 (GET)
+    print("📡 [1단계] 뉴스 데이터 가져오는 중...")
+    items = fetch_items()
+    if items is None:
+        return
+    if not items:
+        print("📭 가져올 뉴스가 없습니다. (DB가 비었거나 모두 처리됨)")
         return
+    print(f"✅ 총 {len(items)}개의 뉴스를 가져왔습니다.")
 
     # 2. AI 변환, 서버 전송, 그리고 로컬 데이터 수집
     print("\n📡 [2단계] AI 번역 및 처리 시작...")
     
     local_save_list = [] # 로컬 저장을 위한 리스트 생성
+    sender = create_sender()
+
+    # (1) AI에게 작업 시키기 - 요청 한도 안에서 여러 기사를 동시에 번역, 실패한 기사는 모아서 다시 시도
+    ai_results = llm.map(lambda item: get_ai_result(item.get("title"), item.get("content")), items,
+                         requeue_rounds=LLM_REQUEUE_ROUNDS)
 
-    for index, item in enumerate(items):
+    for index, (item, ai_data) in enumerate(zip(items, ai_results)):
         article_id = item.get("articleId")
         print(f"▶ [{index+1}/{len(items)}] 처리 중: {article_id}")
 
-        # (1) AI에게 작업 시키기
-        ai_data = get_ai_result(item.get("title"), item.get("content"))
-        
         if ai_data:
             # (2) 데이터 패킷 생성
-            payload = {
-                "articleId": article_id,
-                "languageTarget": "ko",
-                "translatedTitle": ai_data["translatedTitle"],
-                "translatedContent": ai_data["translatedContent"],
-                "summaryText": ai_data["summaryText"],
-                "modelName": "gemini-2.0-flash"
-            }
+            payload = build_payload(article_id, ai_data)
 
             # [추가됨] 로컬 리스트에 저장
             local_save_list.append(payload)
 
-            # (3) 서버로 전송 (POST)
-            try:
-                send_res = requests.post(POST_URL, json=payload)
-                if send_res.status_code == 200:
-                    print("   ㄴ ✅ 서버 전송 성공!")
-                else:
-                    print(f"   ㄴ ❌ 서버 전송 실패: {send_res.status_code}")
-            except Exception as e:
-                print(f"   ㄴ ❌ 전송 오류: {e}")
+            # (3) 서버로 전송 (보낼편지함에 넣으면 모아서 전송)
+            sender.submit(payload)
         else:
-            print("   ㄴ ⚠️ AI 응답 실패로 건너뜁니다.")
-        
-        time.sleep(1) # API 과부하 방지
+            print("   ㄴ ⚠️ AI 응답 실패 (결과를 보내지 않았으므로 다음 실행 때 다시 가져와 번역합니다)")
+
+    sender.flush()
+    print(f"\n✅ {sender.summary()}")
+    sender.close()
+    if memory:
+        print(f"📚 {memory.summary()}")
 
     # 3. 로컬 파일로 저장하기 (모든 작업이 끝난 후)
-    if local_save_list:
-        print(f"\n💾 [3단계] 로컬 파일 저장 중... ({OUTPUT_FILENAME})")
-        try:
-            with open(OUTPUT_FILENAME, 'w', encoding='utf-8') as f:
-                json.dump(local_save_list, f, ensure_ascii=False, indent=2)
-            print("🎉 로컬 저장 완료!")
-        except Exception as e:
-            print(f"❌ 파일 저장 실패: {e}")
-    else:
-        print("\n⚠️ 저장할 데이터가 없습니다.")
+    save_local(local_save_list)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="서버 뉴스 번역 후 결과 전송")
+    parser.add_argument('--worker', action='store_true', help="종료할 때까지 계속 pull -> 번역 -> 전송 (작업자 모드)")
+    if parser.parse_args().worker:
+        run_worker()
+    else:
+        main()
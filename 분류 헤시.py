@@ -1,10 +1,18 @@
 import pandas as pd
 import google.generativeai as genai
-import time
 import os
-import hashlib
+import json
 import re
-import unicodedata
+
+from classification_cache import ClassificationCache
+from content_hash import hash_columns
+from llm_client import LLMClient
+from near_duplicate import cluster_articles
+
+try:
+    from local_classifier import LocalClassifier
+except ImportError: # scikit-learn 미설치 시 로컬 분류 없이 AI로만 분류
+    LocalClassifier = None
 
 # ==========================================
 # 사용자 설정
@@ -15,45 +23,58 @@ API_KEY = ''
 # 2. 파일 경로 설정
 INPUT_FILENAME = 'C:/Users/user/Desktop/일본 뉴스 저장 결과.csv'       # 원본 파일
 OUTPUT_FILENAME = 'C:/Users/user/Desktop/분류및해시결과.csv'   # 결과 파일 (이름 변경 추천)
+JOURNAL_FILENAME = OUTPUT_FILENAME + '.journal'  # 작업 중 체크포인트 (한 줄에 한 기사, 완료 후 삭제)
+
+# 3. 배치 분류 (한 번의 요청에 여러 기사를 묶어 분류, False면 기사마다 1회 요청)
+BATCH_CLASSIFY = True
+BATCH_SIZE = 20
+
+# 4. 분류 캐시 (contentHash 기준, 이미 분류한 기사는 AI 요청 없이 재사용)
+USE_CLASSIFY_CACHE = True
+CLASSIFY_CACHE_FILENAME = 'C:/Users/user/Desktop/분류캐시.db'
+# 분류 프롬프트(classify_text, classify_batch)를 수정하면 버전을 올려주세요. 이전 캐시는 무시됩니다.
+CLASSIFY_PROMPT_VERSION = 'v1'
+
+# 5. 로컬 분류기 (기존 분류 결과로 학습, 신뢰도가 임계값 미만인 기사만 AI로 분류)
+USE_LOCAL_CLASSIFIER = True
+LOCAL_TRAINING_FILES = ['C:/Users/user/Desktop/result/번역및분류결과.csv'] # '카테고리' 컬럼이 있는 CSV
+LOCAL_MODEL_FILENAME = 'C:/Users/user/Desktop/로컬분류모델.pkl'
+LOCAL_CONFIDENCE_THRESHOLD = 0.6
+
+# 6. 유사 기사 묶기 (여러 언론사가 같은 통신사 기사를 실은 경우 대표 기사 1건만 분류/번역)
+GROUP_NEAR_DUPLICATES = True
+NEAR_DUPLICATE_THRESHOLD = 0.5 # 추정 유사도 (0~1, 높을수록 거의 같은 기사만 묶음)
+
+# 7. AI 요청 한도 (사용 중인 Gemini 요금제의 분당 요청 수/토큰 수에 맞게 설정)
+LLM_RPM = 15
+LLM_TPM = 1000000
+LLM_MAX_CONCURRENCY = 4 # 동시에 보낼 최대 요청 수
+LLM_REQUEUE_ROUNDS = 2  # 분류에 실패한 기사를 모아서 다시 시도할 횟수 (그래도 실패하면 다음 실행 때 분류)
 # ==========================================
 
 # Gemini 모델 설정
+MODEL_NAME = 'models/gemini-2.0-flash'
 genai.configure(api_key=API_KEY)
-model = genai.GenerativeModel('models/gemini-2.0-flash')
+model = genai.GenerativeModel(MODEL_NAME)
+llm = LLMClient(model.generate_content, rpm=LLM_RPM, tpm=LLM_TPM, max_concurrency=LLM_MAX_CONCURRENCY)
 
 # ==========================================
-# 해시 계산 함수 (변경 없음)
+# AI 분류 함수 (번역 함수는 삭제됨)
 # ==========================================
-def normalize_text(text: str) -> str:
-    """
-    텍스트 정규화: Unicode NFKC, 앞뒤 공백 제거, 연속 공백 축소
-    """
-    if not text:
-        return ""
-    text = str(text) 
-    text = unicodedata.normalize("NFKC", text)
-    text = text.strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
-
-def compute_content_hash(title: str, content: str) -> str:
-    """
-    contentHash 계산 (SHA-256, hex 64자)
-    """
-    normalized_title = normalize_text(title)
-    normalized_content = normalize_text(content)
-
-    payload = f"{normalized_title}\n{normalized_content}"
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+CATEGORIES = ['Politics', 'Economy', 'Tech', 'Others']
 
-    return digest
+def normalize_category(text):
+    """AI 응답 문자열 -> 4개 카테고리 중 하나 (알 수 없으면 None)"""
+    category = str(text).strip().replace("'", "").replace('"', "")
+    for cat in CATEGORIES:
+        if cat.lower() in category.lower():
+            return cat
+    return None
 
-# ==========================================
-# AI 분류 함수 (번역 함수는 삭제됨)
-# ==========================================
 def classify_text(title, content):
     """
     기사 내용을 보고 Politics, Economy, Tech, Others 중 하나로 분류
+    (API 오류로 실패하면 None - 'Others'로 채우지 않고 다시 시도 대상으로 남김)
     """
     summary_text = f"Title: {title}\nContent: {str(content)[:500]}"
     
@@ -71,20 +92,131 @@ def classify_text(title, content):
     {summary_text}
     """
 
-    max_retries = 2
-    for attempt in range(max_retries):
+    try:
+        response = llm.generate(prompt) # 재시도/백오프는 LLMClient에서 처리
+        return normalize_category(response.text) or "Others"
+    except Exception as e:
+        print(f"   !! 분류 요청 실패: {e}")
+        return None
+
+def parse_json_response(response_text):
+    """AI 응답에서 JSON 추출 (마크다운 코드블록/앞뒤 설명이 섞여 있어도 처리)"""
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        pass
+
+    match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1).strip())
+        except json.JSONDecodeError:
+            pass
+
+    match = re.search(r'\{.*"result".*\}', response_text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except json.JSONDecodeError:
+            pass
+    return None
+
+def classify_batch(articles):
+    """
+    여러 기사를 한 번의 요청으로 분류
+    articles: [(제목, 내용), ...]
+    반환: 같은 순서의 카테고리 리스트 (응답에서 빠졌거나 잘못된 항목은 None)
+          요청 자체가 실패했거나 응답을 해석하지 못하면 None (배치 전체를 다시 시도)
+    """
+    article_text = "\n\n".join(
+        f"[{i}]\nTitle: {title}\nContent: {str(content)[:500]}"
+        for i, (title, content) in enumerate(articles, 1)
+    )
+
+    prompt = f"""
+    Analyze each of the following {len(articles)} news articles and classify each into exactly one of these 4 categories:
+    [Politics, Economy, Tech, Others]
+
+    - If it's about government, laws, diplomacy -> Politics
+    - If it's about markets, stock, inflation, companies -> Economy
+    - If it's about AI, software, gadgets, science -> Tech
+    - Everything else -> Others
+
+    Respond with JSON only. No other text.
+    {{"result": [{{"idx": 1, "category": "Politics"}}, {{"idx": 2, "category": "Others"}}]}}
+
+    Articles:
+    {article_text}
+    """
+
+    try:
+        response = llm.generate(prompt)
+        result = parse_json_response(response.text.strip())
+    except Exception as e:
+        print(f"   !! 배치 분류 요청 실패: {e}")
+        return None
+
+    if isinstance(result, dict):
+        result = result.get("result", [])
+    if not isinstance(result, list):
+        print("   !! 배치 응답 JSON 파싱 실패")
+        return None
+
+    categories = [None] * len(articles)
+
+    for item in result:
         try:
-            response = model.generate_content(prompt)
-            category = response.text.strip().replace("'", "").replace('"', "")
-            for cat in ['Politics', 'Economy', 'Tech', 'Others']:
-                if cat.lower() in category.lower():
-                    return cat
-            return "Others"
-        except Exception as e:
-            if attempt == 0:
-                time.sleep(1)
-            else:
-                return "Others"
+            idx = int(item.get("idx")) - 1
+        except (TypeError, ValueError, AttributeError):
+            continue
+        if 0 <= idx < len(articles):
+            categories[idx] = normalize_category(item.get("category", ""))
+    return categories
+
+# ==========================================
+# 체크포인트 기록 (분류가 끝난 기사를 한 줄씩 추가, 마지막에 CSV로 한 번만 저장)
+# ==========================================
+def apply_journal(df, journal_path):
+    """중단된 작업의 체크포인트를 df에 반영하고 반영한 건수 반환"""
+    if not os.path.exists(journal_path):
+        return 0
+
+    restored = 0
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                index = record['index']
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue # 강제 종료로 마지막 줄이 잘린 경우
+
+            # 입력 파일이 바뀌어 같은 번호에 다른 기사가 있으면 반영하지 않음
+            if index not in df.index or df.at[index, 'contentHash'] != record.get('contentHash'):
+                continue
+
+            df.at[index, '카테고리'] = record['카테고리']
+            df.at[index, '분류완료'] = True
+            restored += 1
+    return restored
+
+def append_journal(journal, index, category, c_hash):
+    """분류 완료된 기사 한 건 기록"""
+    record = {"index": int(index), "카테고리": category, "contentHash": c_hash}
+    journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+    journal.flush()
+
+def classify_articles(articles):
+    """
+    배치 분류 후 응답에서 빠진 기사는 한 건씩 다시 분류 (LLMClient.map의 작업 스레드에서 실행, 실패한 기사는 None)
+    배치 요청 자체가 실패하면 (API 오류, 한도 초과 등) 한 건씩 나눠 요청하지 않고 배치 전체를 다음 회차로 넘김
+    """
+    if not BATCH_CLASSIFY:
+        return [classify_text(title, content) for title, content in articles]
+
+    categories = classify_batch(articles)
+    if categories is None:
+        return [None] * len(articles)
+    return [category or classify_text(title, content) for (title, content), category in zip(articles, categories)]
 
 def main():
     # 1. 파일 읽기
@@ -110,49 +242,143 @@ def main():
         df['분류완료'] = False # '번역완료' 대신 '분류완료' 사용
     if '카테고리' not in df.columns:
         df['카테고리'] = ""
-    if 'contentHash' not in df.columns:
-        df['contentHash'] = "" 
+
+    # 해시 생성 (원문 기준, 전체 행을 한 번에 계산)
+    df['contentHash'] = hash_columns(df)
+
+    # 유사 기사 그룹 (대표 기사의 contentHash, 대표 기사는 자기 해시)
+    if GROUP_NEAR_DUPLICATES:
+        df['중복그룹'] = cluster_articles(
+            zip(df['contentHash'], df['제목'].fillna('').astype(str), df['내용'].fillna('').astype(str)),
+            threshold=NEAR_DUPLICATE_THRESHOLD
+        )
+        copies = df['중복그룹'] != df['contentHash']
+        print(f"유사 기사 {int(copies.sum())}건 (대표 기사의 분류를 그대로 사용)")
+    else:
+        copies = pd.Series(False, index=df.index)
+
+    restored = apply_journal(df, JOURNAL_FILENAME)
+    if restored:
+        print(f"중단된 작업의 체크포인트 {restored}건을 반영했습니다.")
 
     print("분류 및 해시 생성을 시작합니다... (번역 제외)\n")
     
     total_count = len(df)
-    
+    cache = ClassificationCache(CLASSIFY_CACHE_FILENAME, MODEL_NAME, CLASSIFY_PROMPT_VERSION) if USE_CLASSIFY_CACHE else None
+
+    # 이미 작업된 행은 건너뜁니다.
+    # 1) 캐시에 있는 기사는 AI 요청 없이 바로 분류 완료
+    pending = []
+    pending_hashes = set()
     for index, row in df.iterrows():
-        # 이미 작업된 행은 건너뜁니다.
-        if row.get('분류완료') == True:
+        if row.get('분류완료') == True or copies[index]:
+            continue
+        if row['contentHash'] in pending_hashes:
+            copies[index] = True # 완전히 같은 기사는 한 번만 분류
+            continue
+        category = cache.get(row['contentHash']) if cache else None
+        if category is None:
+            pending.append(index)
+            pending_hashes.add(row['contentHash'])
             continue
+        df.at[index, '카테고리'] = category
+        df.at[index, '분류완료'] = True
 
-        title = row.get('제목', '')
-        content = row.get('내용', '')
-        
-        print(f"[{index+1}/{total_count}] 작업 중... {str(title)[:20]}...")
+    if cache:
+        print(f"분류 캐시 적중 {cache.hits}건")
 
-        # 1) 해시 생성 (원문 기준)
-        c_hash = compute_content_hash(str(title), str(content))
-        
-        # 2) 분류 (AI 사용)
-        category = classify_text(title, content)
-        print(f"   -> 분류: {category} | 해시: {c_hash[:10]}...")
+    # 2) 로컬 분류기로 먼저 분류 - 신뢰도가 높은 기사는 AI 요청 없이 분류 완료
+    if USE_LOCAL_CLASSIFIER and pending:
+        local = None
+        if LocalClassifier is None:
+            print("로컬 분류기 사용 불가 (pip install scikit-learn)")
+        else:
+            local = LocalClassifier.load_or_train(LOCAL_MODEL_FILENAME, LOCAL_TRAINING_FILES)
+            if local is None:
+                print("로컬 분류기 학습 데이터가 부족해 AI로만 분류합니다.")
 
-        # 3) 저장 업데이트 (제목, 내용은 원본 유지)
-        df.at[index, '카테고리'] = category
-        df.at[index, 'contentHash'] = c_hash 
-        df.at[index, '분류완료'] = True
+        if local is not None:
+            articles = [(df.loc[index].get('제목', ''), df.loc[index].get('내용', '')) for index in pending]
+            still_pending = []
+            for index, (category, confidence) in zip(pending, local.predict(articles)):
+                if confidence >= LOCAL_CONFIDENCE_THRESHOLD:
+                    df.at[index, '카테고리'] = category
+                    df.at[index, '분류완료'] = True
+                else:
+                    still_pending.append(index)
+            print(f"로컬 분류 {len(pending) - len(still_pending)}건 (학습 {local.n_rows}건, 신뢰도 {LOCAL_CONFIDENCE_THRESHOLD} 이상)")
+            pending = still_pending
 
-        # 실시간 저장
-        try:
-            df.to_csv(OUTPUT_FILENAME, index=False, encoding='utf-8-sig')
-        except PermissionError:
-            print(f"   !! 저장 실패: 파일을 닫아주세요.")
-        
-        # API 호출 속도 조절 (번역을 안 하므로 딜레이를 조금 줄여도 됨)
-        time.sleep(1) 
+    print(f"AI 분류 대상 {len(pending)}건\n")
+    batch_size = BATCH_SIZE if BATCH_CLASSIFY else 1
+    journal = open(JOURNAL_FILENAME, 'a', encoding='utf-8')
+
+    # 3) 분류 (AI 사용) - 요청 한도 안에서 여러 배치를 동시에 요청, 실패한 기사는 모아서 다시 시도
+    queue = pending
+    for round_num in range(LLM_REQUEUE_ROUNDS + 1):
+        if round_num > 0:
+            if not queue:
+                break
+            print(f"\n분류 실패 {len(queue)}건 다시 시도 ({round_num}/{LLM_REQUEUE_ROUNDS})")
+            llm.wait_until_available()
+
+        batches = []
+        for start in range(0, len(queue), batch_size):
+            batch_indices = queue[start:start + batch_size]
+            articles = [(df.loc[index].get('제목', ''), df.loc[index].get('내용', '')) for index in batch_indices]
+            batches.append((batch_indices, articles))
+
+        failed = []
+        done_count = 0
+        for start in range(0, len(batches), LLM_MAX_CONCURRENCY):
+            window = batches[start:start + LLM_MAX_CONCURRENCY]
+            window_size = sum(len(batch_indices) for batch_indices, _ in window)
+            print(f"[{done_count+1}~{done_count+window_size}/{len(queue)}] 분류 중... (요청 {len(window)}개 동시 진행)")
+            results = llm.map(classify_articles, [articles for _, articles in window])
+            done_count += window_size
+
+            classified = []
+            for (batch_indices, _), categories in zip(window, results):
+                for index, category in zip(batch_indices, categories):
+                    if category is None:
+                        failed.append(index)
+                        continue
+                    c_hash = df.at[index, 'contentHash']
+                    print(f"   -> [{index+1}/{total_count}] 분류: {category} | 해시: {c_hash[:10]}...")
+
+                    # 4) 저장 업데이트 (제목, 내용은 원본 유지)
+                    df.at[index, '카테고리'] = category
+                    df.at[index, '분류완료'] = True
+                    classified.append((c_hash, category))
+                    append_journal(journal, index, category, c_hash) # 실시간 저장 (체크포인트)
+
+            if cache:
+                cache.put_many(classified)
+        queue = failed
+
+    if queue:
+        print(f"\n[주의] {len(queue)}건은 분류하지 못했습니다. 다시 실행하면 이어서 분류합니다.")
+
+    # 유사 기사/같은 기사는 대표 기사의 카테고리 사용
+    if copies.any():
+        category_by_hash = dict(zip(df.loc[~copies, 'contentHash'], df.loc[~copies, '카테고리']))
+        group_column = '중복그룹' if GROUP_NEAR_DUPLICATES else 'contentHash'
+        for index in df.index[copies]:
+            category = category_by_hash.get(df.at[index, group_column])
+            if category in CATEGORIES: # 대표 기사가 분류에 실패했으면 다음 실행 때 함께 분류
+                df.at[index, '카테고리'] = category
+                df.at[index, '분류완료'] = True
+
+    journal.close()
+    if cache:
+        cache.close()
 
     try:
         df.to_csv(OUTPUT_FILENAME, index=False, encoding='utf-8-sig')
+        os.remove(JOURNAL_FILENAME) # CSV에 모두 반영되었으므로 체크포인트 삭제
         print(f"\n[완료] 작업이 끝났습니다. '{OUTPUT_FILENAME}' 확인")
     except:
-         print(f"\n[오류] 최종 저장 실패")
+         print(f"\n[오류] 최종 저장 실패 (체크포인트 '{JOURNAL_FILENAME}'는 남겨두었으니 다시 실행하면 반영됩니다)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
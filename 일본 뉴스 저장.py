@@ -2,12 +2,23 @@ import pandas as pd
 import feedparser
 import os
 import re
+import csv
+import json
+import hashlib
 from datetime import datetime, timedelta
 import time
+import threading
+import itertools
 import requests
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from newspaper import Article, Config
 
+from http_cache import ResponseCache
+from seen_store import SeenStore
+from text_filter import KeywordMatcher
+
 # ==========================================
 # [사용자 설정]
 # ==========================================
@@ -17,9 +28,26 @@ INPUT_FILENAME = "C:/Users/Choi/Desktop/일본 rss.xlsx"
 # 결과 파일 경로 (글자 수 제한 없는 csv로 저장)
 OUTPUT_FILENAME = 'C:/Users/Choi/Desktop/일본 뉴스 저장 결과.csv' 
 
+# 중단(오류, Ctrl+C)된 실행이 있으면 결과 파일에 이어서 저장 (이미 저장된 링크는 건너뜀)
+RESUME_INTERRUPTED = True
+
+# RSS 조건부 요청용 캐시 파일 (피드별 ETag / Last-Modified 저장)
+FEED_CACHE_FILENAME = 'C:/Users/Choi/Desktop/일본 rss 캐시.json'
+USE_CONDITIONAL_GET = True  # False면 매번 피드 전체를 다시 받음
+
+# 기사 페이지 응답 캐시 (같은 날 재실행/디버깅 시 네트워크 요청 생략)
+USE_RESPONSE_CACHE = True
+RESPONSE_CACHE_DIR = 'C:/Users/Choi/Desktop/page_cache'
+RESPONSE_CACHE_TTL = 24 * 3600    # 유효 시간(초)
+RESPONSE_CACHE_MAX_MB = 500       # 캐시 폴더 최대 크기(MB), 넘으면 오래 안 쓴 것부터 삭제
+
 # 며칠 전 뉴스까지 수집할지 설정
 DAYS_LIMIT = 3
 
+# 수집 기록 DB (이전 실행에서 이미 수집한 링크/본문은 다시 받지 않음)
+SKIP_SEEN_ENTRIES = True
+SEEN_DB_FILENAME = 'C:/Users/Choi/Desktop/일본 뉴스 수집기록.db'
+
 # [필터링 1] 해외/국제 뉴스 제외 키워드 (URL 및 태그 검사)
 EXCLUDE_KEYWORDS = ['world', 'global', 'international', 'overseas', 'foreign', '국제', '해외', 'english']
 
@@ -29,8 +57,38 @@ GARBAGE_PHRASES = [
     "This website uses cookies", "All rights reserved", "로그인이 필요합니다",
     "무단 전재 및 재배포 금지", "기자 구독"
 ]
+
+# [동시 수집] 여러 기사 본문을 한 번에 받아옴 (False면 기존처럼 한 건씩 순차 수집)
+CONCURRENT_FETCH = True
+MAX_WORKERS = 8       # 전체 동시 다운로드 수
+MAX_PER_HOST = 2      # 같은 언론사(호스트)에 동시에 보낼 최대 요청 수
+REQUEST_DELAY = 0.5   # 같은 호스트에 요청한 뒤 쉬는 시간(초), 서버 부하 방지
+
+# [프로세스 풀 파싱] 다운로드 스레드는 바이트만 받고, 본문 추출(HTML 파싱)은 여러 코어에서 처리
+# (동시 수집 모드에서만 사용, 스레드가 많아도 GIL 때문에 파싱이 한 코어에 묶이는 문제 해결)
+PARSE_IN_PROCESSES = True
+PARSE_WORKERS = os.cpu_count() or 2
 # ==========================================
 
+# 결과 CSV 컬럼 순서
+OUTPUT_COLUMNS = ['수집날짜', '뉴스 보도 날짜', '수집국가', '제목', '내용', '링크', '언론사']
+
+# 실행 중 표시 파일 (정상 종료 시 삭제, 남아 있으면 이전 실행이 중단된 것)
+IN_PROGRESS_MARKER = OUTPUT_FILENAME + '.inprogress'
+
+# 키워드 필터 (시작할 때 한 번만 컴파일)
+EXCLUDE_URL_MATCHER = KeywordMatcher([f'/{kw}/' for kw in EXCLUDE_KEYWORDS] + [f'/{kw}.' for kw in EXCLUDE_KEYWORDS])
+EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
+GARBAGE_MATCHER = KeywordMatcher(GARBAGE_PHRASES)
+
+# 호스트별 동시 요청 제한용 세마포어
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+response_cache = ResponseCache(RESPONSE_CACHE_DIR, ttl=RESPONSE_CACHE_TTL,
+                               max_bytes=RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+                               enabled=USE_RESPONSE_CACHE)
+
 def clean_html(raw_html):
     """HTML 태그 제거"""
     if not raw_html: return ""
@@ -46,95 +104,266 @@ def is_foreign_news(entry):
     title = entry.get('title', '').lower()
     
     # 1. URL 및 제목 검사
-    for keyword in EXCLUDE_KEYWORDS:
-        if f'/{keyword}/' in link or f'/{keyword}.' in link: # URL 패턴
-            return True
-        if keyword in title: # 제목 패턴
-            return True
+    if EXCLUDE_URL_MATCHER.search(link): # URL 패턴
+        return True
+    if EXCLUDE_MATCHER.search(title): # 제목 패턴
+        return True
 
-    # 2. RSS 카테고리(Tags) 검사
+    # 2. RSS 카테고리(Tags) 검사 (태그를 줄바꿈으로 이어 한 번에 검사)
     if 'tags' in entry:
-        for tag in entry.tags:
-            tag_term = tag.get('term', '').lower()
-            for keyword in EXCLUDE_KEYWORDS:
-                if keyword in tag_term:
-                    return True
+        tag_terms = '\n'.join(tag.get('term', '').lower() for tag in entry.tags)
+        if EXCLUDE_MATCHER.search(tag_terms):
+            return True
     return False
 
+# 구글봇 위장 헤더 (쿠키 팝업 우회에 효과적)
+FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'
+}
+
+# 이 길이 미만이면 '잘렸다'고 판단하고 다음 추출기를 시도
+MIN_FULL_CONTENT_LENGTH = 200
+
+def download_page(url):
+    """
+    기사 페이지를 한 번만 내려받아 모든 추출기가 공유할 문서로 반환
+    - raw: 원본 바이트 (BeautifulSoup용, 인코딩 자동 감지)
+    - encoding: Newspaper3k에 넘길 문자열로 디코딩할 때 쓸 인코딩
+    디코딩/파싱은 하지 않음 (프로세스 풀에는 바이트만 넘어가도록)
+    """
+    response = response_cache.fetch(url, headers=FETCH_HEADERS, timeout=15)
+    response.raise_for_status()
+
+    # Newspaper3k와 같은 방식: 헤더에 charset이 없으면 본문 meta 태그에서 인코딩 추정
+    encoding = response.encoding
+    if encoding == 'ISO-8859-1' and 'charset' not in response.headers.get('content-type', ''):
+        encodings = requests.utils.get_encodings_from_content(response.content[:5000].decode('latin-1'))
+        encoding = encodings[0] if encodings else response.apparent_encoding
+    elif encoding is None:
+        encoding = response.apparent_encoding
+
+    return {'url': url, 'raw': response.content, 'encoding': encoding}
+
+def decode_page(page):
+    """페이지 바이트를 문자열로 디코딩 (잘못된 인코딩 이름이면 utf-8로)"""
+    try:
+        return page['raw'].decode(page['encoding'] or 'utf-8', errors='replace')
+    except (LookupError, TypeError):
+        return page['raw'].decode('utf-8', errors='replace')
+
+def extract_with_newspaper(page):
+    """1차: Newspaper3k 파싱 (다운로드 없이 받아온 HTML 사용)"""
+    config = Config()
+    config.browser_user_agent = FETCH_HEADERS['User-Agent']
+    config.memoize_articles = False
+    config.fetch_images = False
+
+    article = Article(page['url'], config=config)
+    article.download(input_html=decode_page(page))
+    article.parse()
+    return article.text.strip()
+
+def extract_paragraphs(page):
+    """2차: BeautifulSoup으로 <p> 태그 강제 수집"""
+    soup = BeautifulSoup(page['raw'], 'html.parser')
+
+    # 모든 <p> 태그 긁어모으기
+    text_list = []
+    for p in soup.find_all('p'):
+        text = p.get_text().strip()
+        # 30자 이상인 문장만 유효한 본문으로 간주 (메뉴 등 제외)
+        if len(text) > 30: 
+            text_list.append(text)
+    return '\n\n'.join(text_list)
+
+# 본문 추출기 목록 (앞에서부터 순서대로 시도, 새 추출 방식은 여기에 추가)
+ARTICLE_EXTRACTORS = [extract_with_newspaper, extract_paragraphs]
+
 def get_full_article(url):
     """
+    페이지는 한 번만 다운로드하고, 같은 문서에 추출기를 순서대로 적용
     1차: Newspaper3k (구글봇 위장)
     2차: 실패/잘림 의심 시 BeautifulSoup으로 <p> 태그 강제 수집
     """
-    # 구글봇 위장 헤더 (쿠키 팝업 우회에 효과적)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'
-    }
-
     try:
-        # -------------------------------------------------------
-        # [1단계] Newspaper3k 시도
-        # -------------------------------------------------------
-        config = Config()
-        config.browser_user_agent = headers['User-Agent']
-        config.request_timeout = 15
-        config.memoize_articles = False
-        config.fetch_images = False
-        
-        article = Article(url, config=config)
-        article.download()
-        article.parse()
-        
-        content = article.text.strip()
-
-        # -------------------------------------------------------
-        # [2단계] 결과 검증 및 강제 수집 (BeautifulSoup)
-        # -------------------------------------------------------
-        # 본문이 200자 미만이면 '잘렸다'고 판단하고 강제 수집 시도
-        if len(content) < 200: 
-            # print(f"    (본문 누락 의심으로 강제 수집 시도...)")
-            try:
-                response = requests.get(url, headers=headers, timeout=15)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 모든 <p> 태그 긁어모으기
-                paragraphs = soup.find_all('p')
-                text_list = []
-                for p in paragraphs:
-                    text = p.get_text().strip()
-                    # 30자 이상인 문장만 유효한 본문으로 간주 (메뉴 등 제외)
-                    if len(text) > 30: 
-                        text_list.append(text)
-                
-                forced_content = '\n\n'.join(text_list)
-                
-                # 강제 수집한 게 더 길면 교체
-                if len(forced_content) > len(content):
-                    content = forced_content
-            except Exception:
-                pass # 강제 수집 실패 시 1단계 결과 유지
-
-        # -------------------------------------------------------
-        # [3단계] 최종 정제 (쿠키 문구 등 삭제)
-        # -------------------------------------------------------
-        if content:
-            lines = content.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                # 쓰레기 문구가 포함된 줄 제거
-                if any(garbage in line for garbage in GARBAGE_PHRASES):
-                    continue
-                cleaned_lines.append(line)
-            content = '\n'.join(cleaned_lines)
+        page = download_page(url)
+    except Exception as e:
+        # print(f"    [Error] {e}")
+        return ""
+    return extract_article(page)
 
-        if len(content) < 50: 
-            return "" # 정제 후에도 너무 짧으면 실패 처리
+def extract_article(page):
+    """
+    받아온 페이지에서 본문 추출 + 정제 (네트워크 없이 CPU만 사용)
+    프로세스 풀에서도 실행되므로 모듈 최상위 함수로 둠
+    """
+    # -------------------------------------------------------
+    # [1~2단계] 추출기 순서대로 시도, 가장 긴 결과 채택
+    # -------------------------------------------------------
+    content = ""
+    for extractor in ARTICLE_EXTRACTORS:
+        try:
+            text = extractor(page)
+        except Exception:
+            continue # 추출 실패 시 다음 추출기로
+        if len(text) > len(content):
+            content = text
+        if len(content) >= MIN_FULL_CONTENT_LENGTH:
+            break
+
+    # -------------------------------------------------------
+    # [3단계] 최종 정제 (쿠키 문구 등 삭제)
+    # -------------------------------------------------------
+    if content:
+        lines = content.split('\n')
+        cleaned_lines = []
+        for line in lines:
+            # 쓰레기 문구가 포함된 줄 제거
+            if GARBAGE_MATCHER.search(line):
+                continue
+            cleaned_lines.append(line)
+        content = '\n'.join(cleaned_lines)
 
-        return content
+    if len(content) < 50: 
+        return "" # 정제 후에도 너무 짧으면 실패 처리
+
+    return content
+
+def load_feed_cache():
+    """피드 캐시 로드 (없거나 깨져 있으면 빈 캐시)"""
+    if not os.path.exists(FEED_CACHE_FILENAME):
+        return {}
+    try:
+        with open(FEED_CACHE_FILENAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
 
+def save_feed_cache(feed_cache):
+    """피드 캐시 저장"""
+    try:
+        with open(FEED_CACHE_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(feed_cache, f, ensure_ascii=False, indent=2)
     except Exception as e:
-        # print(f"    [Error] {e}")
+        print(f"    !! 피드 캐시 저장 실패: {e}")
+
+def poll_feed(rss_url, feed_cache):
+    """
+    ETag / Last-Modified를 보내 조건부로 RSS를 가져옴
+    서버가 304(변경 없음)로 응답하면 파싱하지 않고 None 반환
+    """
+    cached = feed_cache.get(rss_url, {}) if USE_CONDITIONAL_GET else {}
+    feed = feedparser.parse(rss_url, etag=cached.get('etag'), modified=cached.get('modified'))
+
+    if feed.get('status') == 304:
+        return None
+
+    validators = {}
+    if feed.get('etag'):
+        validators['etag'] = feed.etag
+    if feed.get('modified'):
+        validators['modified'] = feed.modified
+    if validators:
+        feed_cache[rss_url] = validators
+    else:
+        feed_cache.pop(rss_url, None)
+    return feed
+
+def get_host_semaphore(url):
+    """URL의 호스트별 세마포어 반환 (없으면 생성)"""
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+        return _host_semaphores[host]
+
+def fetch_with_host_limit(url, parse_pool=None):
+    """
+    호스트별 동시 요청 제한을 지키면서 본문 수집
+    parse_pool이 있으면 다운로드만 하고 본문 추출은 프로세스 풀에 넘긴 뒤 Future 반환
+    """
+    with get_host_semaphore(url):
+        try:
+            page = download_page(url)
+        except Exception:
+            page = None
+        time.sleep(REQUEST_DELAY) # 서버 부하 방지
+
+    if page is None:
         return ""
+    if parse_pool is None:
+        return extract_article(page)
+    return parse_pool.submit(extract_article, page)
+
+def start_parse_pool():
+    """
+    본문 추출용 프로세스 풀 생성 (다운로드 스레드를 만들기 전에 호출)
+    작업자 프로세스를 지금 모두 띄워 다른 스레드가 락을 잡고 있는 상태로 fork되지 않도록 함
+    """
+    parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    parse_pool.submit(int).result()
+    return parse_pool
+
+def iter_articles(links):
+    """
+    여러 기사 본문을 수집해 입력 순서대로 하나씩 반환 (앞 기사가 끝나는 즉시)
+    CONCURRENT_FETCH가 켜져 있으면 스레드 풀로 동시에 수집
+    PARSE_IN_PROCESSES가 켜져 있으면 본문 추출은 프로세스 풀에서 처리
+    """
+    if not CONCURRENT_FETCH:
+        for link in links:
+            yield fetch_with_host_limit(link)
+        return
+
+    # 같은 언론사 기사가 연달아 있으면 워커가 세마포어에서 대기만 하므로
+    # 호스트별로 번갈아 가며 작업을 제출
+    by_host = {}
+    for i, link in enumerate(links):
+        by_host.setdefault(urlparse(link).netloc.lower(), []).append(i)
+    order = [i for group in itertools.zip_longest(*by_host.values()) for i in group if i is not None]
+
+    parse_pool = start_parse_pool() if PARSE_IN_PROCESSES else None
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = [None] * len(links)
+        for i in order:
+            futures[i] = executor.submit(fetch_with_host_limit, links[i], parse_pool)
+        for done, future in enumerate(futures, 1):
+            content = future.result()
+            if isinstance(content, Future): # 프로세스 풀에서 추출 중
+                try:
+                    content = content.result()
+                except Exception:
+                    content = ""
+            if done % 20 == 0 or done == len(links):
+                print(f"    ... 본문 수집 {done}/{len(links)}")
+            yield content
+    finally:
+        # 중단(Ctrl+C 등) 시 남은 작업은 기다리지 않고 취소
+        executor.shutdown(wait=False, cancel_futures=True)
+        if parse_pool:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+
+def load_written_links():
+    """중단된 이전 실행의 결과 파일에 이미 저장된 링크 목록"""
+    if not (RESUME_INTERRUPTED and os.path.exists(IN_PROGRESS_MARKER) and os.path.exists(OUTPUT_FILENAME)):
+        return []
+    try:
+        with open(OUTPUT_FILENAME, 'r', encoding='utf-8-sig', newline='') as f:
+            return [row.get('링크', '') for row in csv.DictReader(f)]
+    except Exception as e:
+        print(f"    !! 이전 결과 파일 읽기 실패, 새로 시작합니다: {e}")
+        return []
+
+def open_output(resume):
+    """결과 CSV 열기 (이어쓰기면 헤더 없이 추가, 아니면 새로 작성)"""
+    f = open(OUTPUT_FILENAME, 'a' if resume else 'w', encoding='utf-8-sig', newline='')
+    # pandas to_csv와 같은 형식 (QUOTE_MINIMAL, OS 기본 줄바꿈)
+    writer = csv.writer(f, lineterminator=os.linesep)
+    if not resume:
+        writer.writerow(OUTPUT_COLUMNS)
+        f.flush()
+    return f, writer
 
 def main():
     if not os.path.exists(INPUT_FILENAME):
@@ -144,7 +373,16 @@ def main():
     df_urls = pd.read_excel(INPUT_FILENAME)
     print(f"'{INPUT_FILENAME}' 로딩 완료. 뉴스 수집 시작...\n")
 
-    all_news = []
+    feed_cache = load_feed_cache()
+    seen_store = SeenStore(SEEN_DB_FILENAME) if SKIP_SEEN_ENTRIES else None
+
+    written_links = load_written_links()
+    if written_links:
+        print(f"중단된 이전 실행을 이어서 진행합니다. (저장된 {len(written_links)}건, 마지막: {written_links[-1]})\n")
+
+    # 이번 실행에서 이미 대상에 넣은 링크 (여러 피드에 같은 기사가 있는 경우 + 이어쓰기로 저장된 링크)
+    run_links = set(written_links)
+    candidates = [] # (언론사, 수집국가, entry) - 본문 수집 대상
     cutoff_date = datetime.now() - timedelta(days=DAYS_LIMIT)
 
     for index, row in df_urls.iterrows():
@@ -156,14 +394,19 @@ def main():
         print(f"\n>>> [{press_name}] 분석 중...")
         
         try:
-            feed = feedparser.parse(rss_url)
+            feed = poll_feed(rss_url, feed_cache)
         except Exception as e:
             print(f"    RSS 접속 실패: {e}")
             continue
 
+        if feed is None:
+            print(f"    => 변경 없음 (304), 건너뜁니다.")
+            continue
+
         country_info = feed.feed.get('language', 'Unknown')
         
         count = 0
+        skipped = 0
         for entry in feed.entries:
             # 1. 해외 뉴스 필터링
             if is_foreign_news(entry):
@@ -176,15 +419,42 @@ def main():
                 if datetime(*date_parsed[:6]) < cutoff_date:
                     continue
             
-            # 3. 본문 수집
-            title = entry.get('title', '')
+            # 3. 이미 수집한 기사 제외 (이전 실행 기록 + 이번 실행 중복)
             link = entry.get('link', '')
-            pub_date_str = entry.get('published', entry.get('updated', ''))
-            
-            print(f"    - 수집 중: {title[:30]}...")
-            
-            full_content = get_full_article(link)
-            
+            if link in run_links or (seen_store and seen_store.has_link(link)):
+                skipped += 1
+                continue
+            run_links.add(link)
+
+            # 4. 본문 수집 대상에 추가 (실제 수집은 아래에서 한꺼번에)
+            title = entry.get('title', '')
+            print(f"    - 수집 대상: {title[:30]}...")
+
+            candidates.append((press_name, country_info, entry))
+            count += 1
+
+        print(f"    => {count}건 수집 대상." + (f" (이미 수집 {skipped}건 제외)" if skipped else ""))
+
+    if not candidates:
+        print("\n수집된 데이터가 없습니다.")
+        if written_links:
+            os.remove(IN_PROGRESS_MARKER) # 이어서 할 기사가 없으므로 이전 실행도 완료 처리
+        save_feed_cache(feed_cache)
+        if seen_store:
+            seen_store.close()
+        return
+
+    # 5. 본문 수집 + 수집되는 대로 결과 파일에 바로 저장 (RSS 순서 그대로)
+    print(f"\n본문 수집 시작... (총 {len(candidates)}건)")
+    resume = bool(written_links)
+    open(IN_PROGRESS_MARKER, 'w').close()
+    output_file, writer = open_output(resume)
+
+    saved_count = 0
+    run_digests = set()
+    contents = iter_articles([entry.get('link', '') for _, _, entry in candidates])
+    try:
+        for (press_name, country_info, entry), full_content in zip(candidates, contents):
             # 본문 수집 실패 시 요약본 사용
             if not full_content:
                 rss_summary = entry.get('summary', entry.get('description', ''))
@@ -192,27 +462,52 @@ def main():
             else:
                 final_content = full_content
 
-            all_news.append({
-                '수집날짜': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                '뉴스 보도 날짜': pub_date_str,
-                '수집국가': country_info,
-                '제목': title,
-                '내용': final_content,
-                '링크': link,
-                '언론사': press_name
-            })
-            count += 1
-            time.sleep(0.5) # 서버 부하 방지
+            # 링크만 다르고 본문이 같은 기사는 이미 수집한 것으로 처리
+            # (요약본은 비어 있거나 서로 겹치기 쉬워 본문 비교에서 제외)
+            link = entry.get('link', '')
+            content_digest = None
+            if full_content:
+                content_digest = hashlib.sha256(final_content.encode('utf-8')).hexdigest()
+            is_duplicate = content_digest is not None and (
+                content_digest in run_digests or (seen_store and seen_store.has_content(content_digest)))
 
-        print(f"    => {count}건 수집 완료.")
+            if not is_duplicate:
+                if content_digest:
+                    run_digests.add(content_digest)
+                writer.writerow([
+                    datetime.now().strftime('%Y-%m-%d %H:%M:%S'), # 수집날짜
+                    entry.get('published', entry.get('updated', '')), # 뉴스 보도 날짜
+                    country_info, # 수집국가
+                    entry.get('title', ''), # 제목
+                    final_content, # 내용
+                    link, # 링크
+                    press_name # 언론사
+                ])
+                output_file.flush() # 중단되어도 여기까지는 파일에 남도록
+                saved_count += 1
 
-    if all_news:
-        df_result = pd.DataFrame(all_news)
-        # 엑셀 대신 CSV로 저장 (글자수 제한 해결, 한글 깨짐 방지 utf-8-sig)
-        df_result.to_csv(OUTPUT_FILENAME, index=False, encoding='utf-8-sig')
-        print(f"\n[최종 완료] 총 {len(all_news)}건 저장 완료: {OUTPUT_FILENAME}")
-    else:
-        print("\n수집된 데이터가 없습니다.")
+            # 파일에 기록한 뒤에 수집 기록 추가
+            # 요약본으로 대신한 기사는 기록하지 않음 (다음 실행 때 본문을 다시 시도)
+            if seen_store and content_digest:
+                seen_store.add_many([(link, content_digest)])
+    finally:
+        contents.close() # 남은 수집 작업 정리
+        output_file.close()
+
+    if USE_RESPONSE_CACHE:
+        print(f"    ({response_cache.summary()})")
+
+    # 끝까지 저장했으면 실행 중 표시 삭제
+    os.remove(IN_PROGRESS_MARKER)
+    total = len(written_links) + saved_count
+    # CSV (글자수 제한 없음, 한글 깨짐 방지 utf-8-sig)
+    print(f"\n[최종 완료] 총 {total}건 저장 완료: {OUTPUT_FILENAME}" + (f" (이번 실행 {saved_count}건)" if resume else ""))
+
+    # 피드 캐시는 결과 저장이 끝난 뒤에 기록 (중간에 실패하면 다음 실행 때 피드를 다시 받음)
+    save_feed_cache(feed_cache)
+    if seen_store:
+        print(f"수집 기록: 누적 {seen_store.count()}건")
+        seen_store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -29,8 +29,18 @@ from bs4 import BeautifulSoup
 import time
 from datetime import datetime
 import pytz
-from urllib.parse import urljoin
+from urllib.parse import urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import os
+import threading
+
+# 같은 폴더의 보조 모듈 (Colab에서는 작업 디렉터리에 함께 업로드)
+from link_harvest import harvest_links
+from http_cache import ResponseCache
+from text_filter import KeywordMatcher
+from near_duplicate import NearDuplicateIndex
+from llm_client import LLMClient, estimate_tokens
 
 # ============================================
 # 설정
@@ -54,6 +64,13 @@ except Exception as e:
 
 client = Anthropic(api_key=API_KEY)
 
+# Claude 요청 한도 (사용 중인 요금제의 분당 요청 수/토큰 수에 맞게 설정)
+CLAUDE_RPM = 50
+CLAUDE_TPM = 30000
+CLAUDE_MAX_CONCURRENCY = 4 # 동시에 검증할 최대 배치 수
+CLAUDE_REQUEUE_ROUNDS = 2  # 검증 요청에 실패한 배치를 모아서 다시 시도할 횟수
+VALIDATION_MAX_TOKENS = 3000
+
 # 뉴스 소스
 NEWS_SOURCES = {
     "人民日报": {
@@ -95,6 +112,41 @@ NEWS_SOURCES = {
 
 COUNTRY = "中国"
 
+# 기사 페이지 요청 설정
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+PAGE_TIMEOUT = 8
+PAGE_CACHE_SIZE = 32  # 메모리에 유지할 최근 페이지 수 (날짜/본문 추출이 같은 페이지 공유)
+
+# 기사 페이지 다운로드/파싱 분리: 스레드는 바이트만 받고, 날짜/본문 추출(HTML 파싱)은 프로세스 풀에서
+PARSE_IN_PROCESSES = True
+FETCH_WORKERS = 8
+PARSE_WORKERS = os.cpu_count() or 2
+
+# 기사 페이지 응답 캐시 (같은 날 재실행/디버깅 시 네트워크 요청 생략, 홈페이지는 캐시하지 않음)
+USE_RESPONSE_CACHE = True
+RESPONSE_CACHE_DIR = os.path.join(OUTPUT_DIR, "page-cache")
+RESPONSE_CACHE_TTL = 24 * 3600    # 유효 시간(초)
+RESPONSE_CACHE_MAX_MB = 300       # 캐시 폴더 최대 크기(MB), 넘으면 오래 안 쓴 것부터 삭제
+
+# 홈페이지 링크 수집 시 제외할 제목 키워드 (메뉴, 광고, 에러 문구 등)
+SPAM_KEYWORDS = [
+    '·', '栏目', '分类', '导航', '菜单', '更多', '首页',
+    '订阅', '登录', '注册', '频道', '搜索', '用户', '广告',
+    'Русский', 'Português', 'English', 'Français', '日本語',
+    '403', '404', 'Forbidden', 'Error', '错误',
+    '扫码', '微信', '长按', '关注',
+    '备案', '版权', 'ICP', '联系', '关于',
+    '精彩内容', '最新视频', 'THE LATEST',
+]
+SPAM_MATCHER = KeywordMatcher(SPAM_KEYWORDS) # 한 번만 컴파일
+
+# 홈페이지 링크 수집용 HTML 파서 ("auto", "selectolax", "lxml", "html.parser")
+HTML_PARSER_BACKEND = "auto"
+
+# 유사 기사 묶기 (여러 언론사에 실린 같은 통신사 기사는 대표 기사만 records에 저장하고,
+# 나머지는 duplicate_of(대표 기사 링크)를 붙여 duplicates에 따로 보관 -> 번역/업로드 대상은 records뿐)
+NEAR_DUPLICATE_THRESHOLD = 0.5
+
 AI_PROMPT = """
 중국 뉴스 분석 기자입니다.
 각 제목이 실제 뉴스인지 판단하세요.
@@ -110,6 +162,23 @@ JSON으로만 응답. 다른 텍스트 없음.
 # 유틸리티 함수
 # ============================================
 
+def ask_claude(prompt):
+    """뉴스 검증 요청 (AI_PROMPT를 시스템 프롬프트로 사용)"""
+    return client.messages.create(
+        model="claude-opus-4-1-20250805",
+        max_tokens=VALIDATION_MAX_TOKENS,
+        system=AI_PROMPT,
+        messages=[
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    )
+
+llm = LLMClient(ask_claude, rpm=CLAUDE_RPM, tpm=CLAUDE_TPM, max_concurrency=CLAUDE_MAX_CONCURRENCY,
+                max_output_tokens=VALIDATION_MAX_TOKENS)
+
 def get_today_date():
     """한국 시간대 기준 오늘 날짜 (YYYY-MM-DD)"""
     now = datetime.now(korea_tz)
@@ -130,6 +199,20 @@ def check_duplicate(new_record, existing_records):
             return True
     return False
 
+def mark_near_duplicates(existing_records, new_records):
+    """새 기사 중 기존/앞선 기사와 거의 같은 기사에 duplicate_of(대표 기사 링크) 표시, 표시한 건수 반환"""
+    index = NearDuplicateIndex(threshold=NEAR_DUPLICATE_THRESHOLD)
+    for record in existing_records:
+        index.add(record['link'], f"{record['title']}\n{record['content']}")
+
+    marked = 0
+    for record in new_records:
+        representative = index.add(record['link'], f"{record['title']}\n{record['content']}")
+        if representative != record['link']:
+            record['duplicate_of'] = representative
+            marked += 1
+    return marked
+
 # ============================================
 # DB 관리
 # ============================================
@@ -190,76 +273,19 @@ def collect_news(source_name, source_info):
         url = source_info["url"]
         print(f"  🔗 {source_name} [{source_info['reliability']}]...", end=" ")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        spam_keywords = [
-            '·', '栏目', '分类', '导航', '菜单', '更多', '首页',
-            '订阅', '登录', '注册', '频道', '搜索', '用户', '广告',
-            'Русский', 'Português', 'English', 'Français', '日本語',
-            '403', '404', 'Forbidden', 'Error', '错误',
-            '扫码', '微信', '长按', '关注',
-            '备案', '版权', 'ICP', '联系', '关于',
-            '精彩内容', '最新视频', 'THE LATEST',
-        ]
-
-        raw_news = []
-
-        # h1, h2, h3에서 수집
-        for tag_name in ['h1', 'h2', 'h3']:
-            for tag in soup.find_all(tag_name):
-                title = tag.get_text(strip=True)
-                if any(keyword in title for keyword in spam_keywords) or not (8 < len(title) < 150):
-                    continue
-
-                link = ""
-                a_tag = tag.find('a')
-                if a_tag and a_tag.get('href'):
-                    link = a_tag.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-
-                raw_news.append({
-                    "source": source_name,
-                    "source_reliability": source_info["reliability"],
-                    "source_category": source_info["category"],
-                    "title_zh": title,
-                    "link": link
-                })
-
-        # a 태그에서도 수집
-        for a_tag in soup.find_all('a'):
-            title = a_tag.get_text(strip=True)
-            link = a_tag.get('href', '')
-
-            if any(keyword in title for keyword in spam_keywords) or not (8 < len(title) < 150):
-                continue
-            if not link or link.startswith('javascript') or any(item['title_zh'] == title for item in raw_news):
-                continue
-
-            if not link.startswith('http'):
-                link = urljoin(url, link)
+        response = get_session(url).get(url, timeout=10)
 
-            raw_news.append({
+        # h1, h2, h3 -> a 태그 순서로 수집 (제목 기준 중복 제거)
+        unique_news = [
+            {
                 "source": source_name,
                 "source_reliability": source_info["reliability"],
                 "source_category": source_info["category"],
-                "title_zh": title,
-                "link": link
-            })
-
-        # 중복 제거
-        unique_news = []
-        seen = set()
-        for item in raw_news:
-            if item['title_zh'] not in seen:
-                seen.add(item['title_zh'])
-                unique_news.append(item)
+                "title_zh": item["title"],
+                "link": item["link"]
+            }
+            for item in harvest_links(response.content, url, SPAM_MATCHER, backend=HTML_PARSER_BACKEND)
+        ]
 
         # 모든 뉴스 수집 (제한 없음)
         print(f"✅ {len(unique_news)}개")
@@ -269,6 +295,73 @@ def collect_news(source_name, source_info):
         print(f"❌")
         return []
 
+# ============================================
+# 페이지 공유 (URL당 다운로드/파싱 1회)
+# ============================================
+
+_sessions = {}              # 호스트별 requests.Session (연결 재사용)
+_sessions_lock = threading.Lock()
+_page_cache = OrderedDict() # URL -> 페이지 (최근 PAGE_CACHE_SIZE개만 유지)
+
+response_cache = ResponseCache(RESPONSE_CACHE_DIR, ttl=RESPONSE_CACHE_TTL,
+                               max_bytes=RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+                               enabled=USE_RESPONSE_CACHE)
+
+# 본문 추출 시 제외할 태그 (공유 트리를 수정하지 않고 건너뜀)
+NON_CONTENT_TAGS = {'script', 'style', 'nav', 'footer', 'noscript', 'meta'}
+
+def get_session(url):
+    """호스트별 세션 반환 (없으면 생성)"""
+    host = urlparse(url).netloc.lower()
+    with _sessions_lock: # 다운로드 스레드들이 동시에 호출
+        if host not in _sessions:
+            session = requests.Session()
+            session.headers.update(REQUEST_HEADERS)
+            _sessions[host] = session
+        return _sessions[host]
+
+def get_page(link):
+    """
+    페이지를 한 번만 받아 파싱하고 캐시에 보관
+    반환: {"url", "soup"} / 실패 시 None (실패도 캐시해서 재요청하지 않음)
+    """
+    if link in _page_cache:
+        _page_cache.move_to_end(link)
+        return _page_cache[link]
+
+    try:
+        response = response_cache.fetch(link, session=get_session(link), timeout=PAGE_TIMEOUT)
+        page = {
+            "url": link,
+            "soup": BeautifulSoup(response.content, 'html.parser')
+        }
+    except Exception:
+        page = None
+
+    _page_cache[link] = page
+    if len(_page_cache) > PAGE_CACHE_SIZE:
+        _page_cache.popitem(last=False)
+    return page
+
+def is_non_content(element):
+    """element 자신이나 상위 태그가 본문 제외 태그인지"""
+    if element.name in NON_CONTENT_TAGS:
+        return True
+    return any(parent.name in NON_CONTENT_TAGS for parent in element.parents)
+
+def visible_text(tag, strip=False):
+    """제외 태그 안의 텍스트를 뺀 get_text() (트리를 수정하지 않음)"""
+    texts = []
+    for string in tag.strings:
+        if is_non_content(string):
+            continue
+        if strip:
+            string = string.strip()
+            if not string:
+                continue
+        texts.append(string)
+    return ''.join(texts)
+
 # ============================================
 # 기사 날짜 추출
 # ============================================
@@ -276,33 +369,52 @@ def collect_news(source_name, source_info):
 def extract_article_date(link):
     """원문에서 발행 날짜 추출 (명확한 경우만)"""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(link, headers=headers, timeout=8)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        patterns = [
-            r'(\d{4})[年-](\d{1,2})[月-](\d{1,2})[日号]',  # 2024年12月21日
-            r'(\d{4})-(\d{2})-(\d{2})',                     # 2024-12-21
-        ]
-
-        found_dates = []
-
-        # 메타 태그 확인
-        for meta in soup.find_all('meta'):
-            properties = [meta.get('property', '').lower(), meta.get('name', '').lower()]
-            if any(p in ['publish_date', 'article:published_time', 'og:published_time']
-                   for p in properties):
-                content = meta.get('content', '')
-                if content:
-                    match = re.search(r'(\d{4})-(\d{2})-(\d{2})', content)
-                    if match:
-                        found_dates.append(('메타', match.group(0)))
+        page = get_page(link)
+        if page is None:
+            return None
+        return find_article_date(page["soup"])
+    except Exception as e:
+        return None
 
-        # 본문 처음 2000자에서 날짜 찾기
-        full_text = soup.get_text()
+def find_article_date(soup):
+    """파싱된 페이지에서 발행 날짜 찾기 (명확한 경우만, 날짜가 엇갈리면 None)"""
+    patterns = [
+        r'(\d{4})[年-](\d{1,2})[月-](\d{1,2})[日号]',  # 2024年12月21日
+        r'(\d{4})-(\d{2})-(\d{2})',                     # 2024-12-21
+    ]
+
+    found_dates = []
+
+    # 메타 태그 확인
+    for meta in soup.find_all('meta'):
+        properties = [meta.get('property', '').lower(), meta.get('name', '').lower()]
+        if any(p in ['publish_date', 'article:published_time', 'og:published_time']
+               for p in properties):
+            content = meta.get('content', '')
+            if content:
+                match = re.search(r'(\d{4})-(\d{2})-(\d{2})', content)
+                if match:
+                    found_dates.append(('메타', match.group(0)))
+
+    # 본문 처음 2000자에서 날짜 찾기
+    full_text = soup.get_text()
+    for pattern in patterns:
+        match = re.search(pattern, full_text[:2000])
+        if match:
+            if len(match.groups()) == 3:
+                year, month, day = match.groups()
+                year, month, day = int(year), int(month), int(day)
+
+                if 2020 <= year <= 2026 and 1 <= month <= 12 and 1 <= day <= 31:
+                    date_str = f"{year:04d}-{month:02d}-{day:02d}"
+                    found_dates.append(('본문', date_str))
+
+    # 소스 정보에서 날짜 찾기
+    source_section = soup.find(class_=re.compile('(source|from|byline|info)', re.I))
+    if source_section:
+        source_text = source_section.get_text()
         for pattern in patterns:
-            match = re.search(pattern, full_text[:2000])
+            match = re.search(pattern, source_text)
             if match:
                 if len(match.groups()) == 3:
                     year, month, day = match.groups()
@@ -310,36 +422,18 @@ def extract_article_date(link):
 
                     if 2020 <= year <= 2026 and 1 <= month <= 12 and 1 <= day <= 31:
                         date_str = f"{year:04d}-{month:02d}-{day:02d}"
-                        found_dates.append(('본문', date_str))
-
-        # 소스 정보에서 날짜 찾기
-        source_section = soup.find(class_=re.compile('(source|from|byline|info)', re.I))
-        if source_section:
-            source_text = source_section.get_text()
-            for pattern in patterns:
-                match = re.search(pattern, source_text)
-                if match:
-                    if len(match.groups()) == 3:
-                        year, month, day = match.groups()
-                        year, month, day = int(year), int(month), int(day)
+                        found_dates.append(('소스', date_str))
 
-                        if 2020 <= year <= 2026 and 1 <= month <= 12 and 1 <= day <= 31:
-                            date_str = f"{year:04d}-{month:02d}-{day:02d}"
-                            found_dates.append(('소스', date_str))
-
-        # 결과 검증 (모든 날짜가 일치해야 함)
-        if not found_dates:
-            return None
+    # 결과 검증 (모든 날짜가 일치해야 함)
+    if not found_dates:
+        return None
 
-        unique_dates = set(date for _, date in found_dates)
+    unique_dates = set(date for _, date in found_dates)
 
-        if len(unique_dates) == 1:
-            return unique_dates.pop()
-        else:
-            # 날짜 불일치
-            return None
-
-    except Exception as e:
+    if len(unique_dates) == 1:
+        return unique_dates.pop()
+    else:
+        # 날짜 불일치
         return None
 
 # ============================================
@@ -349,56 +443,118 @@ def extract_article_date(link):
 def get_article_content(link):
     """기사 본문 추출"""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(link, headers=headers, timeout=8)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        for tag in soup.find_all(['script', 'style', 'nav', 'footer', 'noscript', 'meta']):
-            tag.decompose()
-
-        content = ""
-
-        article = soup.find('article')
-        if article:
-            text = article.get_text(strip=True)
-            if len(text) > 50:
-                content = text
-
-        if not content or len(content) < 50:
-            for selector in ['content', 'article', 'news', 'main']:
-                div = soup.find(id=selector)
-                if div:
-                    text = div.get_text(strip=True)
-                    if len(text) > 50:
-                        content = text
-                        break
-
-        if not content or len(content) < 50:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                valid = [p.get_text(strip=True) for p in paragraphs
-                        if len(p.get_text(strip=True)) > 20
-                        and '责任编辑' not in p.get_text()]
-                if valid:
-                    content = '\n'.join(valid[:15])
-
-        if content:
-            content = re.sub(r'\n\s*\n', '\n', content)
-            if '责任编辑' in content:
-                content = content.split('责任编辑')[0]
-            return content[:500].strip()
-
-        return "원문 로드 실패"
+        page = get_page(link)
+        if page is None:
+            return "원문 로드 실패"
+        return find_article_content(page["soup"])
     except Exception as e:
         return "원문 로드 실패"
 
+def find_article_content(soup):
+    """파싱된 페이지에서 본문 찾기 (최대 500자)"""
+    # 날짜 추출과 같은 트리를 쓰므로 decompose 대신 제외 태그를 건너뛰며 읽음
+    content = ""
+
+    article = next((a for a in soup.find_all('article') if not is_non_content(a)), None)
+    if article:
+        text = visible_text(article, strip=True)
+        if len(text) > 50:
+            content = text
+
+    if not content or len(content) < 50:
+        for selector in ['content', 'article', 'news', 'main']:
+            div = next((d for d in soup.find_all(id=selector) if not is_non_content(d)), None)
+            if div:
+                text = visible_text(div, strip=True)
+                if len(text) > 50:
+                    content = text
+                    break
+
+    if not content or len(content) < 50:
+        paragraphs = [p for p in soup.find_all('p') if not is_non_content(p)]
+        if paragraphs:
+            texts = (visible_text(p, strip=True) for p in paragraphs)
+            valid = [text for text in texts if len(text) > 20 and '责任编辑' not in text]
+            if valid:
+                content = '\n'.join(valid[:15])
+
+    if content:
+        content = re.sub(r'\n\s*\n', '\n', content)
+        if '责任编辑' in content:
+            content = content.split('责任编辑')[0]
+        return content[:500].strip()
+
+    return "원문 로드 실패"
+
+# ============================================
+# 병렬 분석 (다운로드 스레드 + 파싱 프로세스)
+# ============================================
+
+def fetch_page_bytes(link):
+    """페이지 바이트만 다운로드 (파싱하지 않음), 실패 시 None"""
+    try:
+        response = response_cache.fetch(link, session=get_session(link), timeout=PAGE_TIMEOUT)
+        return response.content
+    except Exception:
+        return None
+
+def analyze_page(content):
+    """(프로세스 풀 작업) 페이지를 한 번 파싱해 (날짜, 본문) 반환"""
+    soup = BeautifulSoup(content, 'html.parser')
+    try:
+        article_date = find_article_date(soup)
+    except Exception:
+        article_date = None
+    try:
+        article_content = find_article_content(soup)
+    except Exception:
+        article_content = "원문 로드 실패"
+    return article_date, article_content
+
+def start_parse_pool():
+    """
+    파싱용 프로세스 풀 생성 (실행당 1회)
+    다운로드/AI 요청 스레드가 생기기 전에 호출해야 함: 작업자 프로세스를 지금 모두 띄워
+    다른 스레드가 락을 잡고 있는 상태로 fork되지 않도록 함
+    """
+    parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    parse_pool.submit(int).result()
+    return parse_pool
+
+def analyze_pages(links, parse_pool):
+    """
+    여러 링크의 (날짜, 본문)을 한꺼번에 추출
+    다운로드는 스레드 풀, 파싱은 프로세스 풀 (start_parse_pool()로 만든 풀을 재사용)
+    반환: {링크: (날짜, 본문)}
+    """
+    links = list(dict.fromkeys(link for link in links if link))
+    results = {}
+    if not links:
+        return results
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetch_pool:
+        futures = {}
+        # 다운로드가 끝나는 대로 (입력 순서) 파싱 작업 제출
+        for link, content in zip(links, fetch_pool.map(fetch_page_bytes, links)):
+            if content is None:
+                results[link] = (None, "원문 로드 실패")
+            else:
+                futures[link] = parse_pool.submit(analyze_page, content)
+
+        for link, future in futures.items():
+            try:
+                results[link] = future.result()
+            except Exception:
+                results[link] = (None, "원문 로드 실패")
+
+    return results
+
 # ============================================
 # AI 검증
 # ============================================
 
-def validate_news(raw_news_list, today_date):
-    """AI 검증 + 당일 날짜 필터링 (배치 처리)"""
+def validate_news(raw_news_list, today_date, parse_pool=None):
+    """AI 검증 + 당일 날짜 필터링 (배치 처리, parse_pool이 있으면 페이지 파싱을 프로세스 풀에서)"""
     if not raw_news_list:
         return []
 
@@ -407,34 +563,37 @@ def validate_news(raw_news_list, today_date):
 
     db_records = []
     batch_size = 50
+    batches = [raw_news_list[i:i + batch_size] for i in range(0, len(raw_news_list), batch_size)]
+    total_batches = len(batches)
 
-    # 배치로 나누어 처리
-    for batch_idx in range(0, len(raw_news_list), batch_size):
-        batch = raw_news_list[batch_idx:batch_idx + batch_size]
-        batch_num = batch_idx // batch_size + 1
-        total_batches = (len(raw_news_list) + batch_size - 1) // batch_size
-
-        print(f"🔍 배치 {batch_num}/{total_batches} 검증 중... ({len(batch)}개)")
-
+    def request_validation(batch):
+        """배치 하나 검증 요청 -> 응답 텍스트 (실패하면 None, 재시도 대상)"""
         news_text = "\n".join([
             f"{i}. [{item['source']}] {item['title_zh']}"
             for i, item in enumerate(batch, 1)
         ])
-
+        prompt = f"뉴스 검증:\n{news_text}"
         try:
-            response = client.messages.create(
-                model="claude-opus-4-1-20250805",
-                max_tokens=3000,
-                system=AI_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"뉴스 검증:\n{news_text}"
-                    }
-                ]
-            )
+            response = llm.generate(prompt, estimated_tokens=estimate_tokens(AI_PROMPT + prompt) + VALIDATION_MAX_TOKENS)
+            return response.content[0].text.strip()
+        except Exception as e:
+            print(f"⚠️  검증 요청 실패: {str(e)}")
+            return None
+
+    # 모든 배치를 요청 한도 안에서 동시에 검증 요청 (실패한 배치는 모아서 다시 요청)
+    print(f"🔍 {total_batches}개 배치 검증 요청 중... (최대 {CLAUDE_MAX_CONCURRENCY}개 동시)")
+    responses = llm.map(request_validation, batches, requeue_rounds=CLAUDE_REQUEUE_ROUNDS)
 
-            response_text = response.content[0].text.strip()
+    # 배치로 나누어 처리
+    for batch_idx, (batch, response_text) in enumerate(zip(batches, responses)):
+        batch_num = batch_idx + 1
+
+        print(f"🔍 배치 {batch_num}/{total_batches} 결과 처리 중... ({len(batch)}개)")
+
+        try:
+            if response_text is None:
+                print(f"⚠️  배치 {batch_num}: 검증 요청 실패, 건너뜀\n")
+                continue
 
             # JSON 파싱
             result = None
@@ -460,6 +619,16 @@ def validate_news(raw_news_list, today_date):
                 print(f"⚠️  배치 {batch_num}: JSON 파싱 실패, 건너뜀\n")
                 continue
 
+            # 뉴스로 판정된 링크는 미리 한꺼번에 다운로드/파싱
+            analyses = {}
+            if parse_pool is not None:
+                news_links = [
+                    batch[item.get("idx", 1) - 1]["link"]
+                    for item in result.get("result", [])
+                    if item.get("is_news", False) and 0 <= item.get("idx", 1) - 1 < len(batch)
+                ]
+                analyses = analyze_pages(news_links, parse_pool)
+
             # 배치 처리 결과
             batch_added = 0
             for item in result.get("result", []):
@@ -468,8 +637,12 @@ def validate_news(raw_news_list, today_date):
                     if 0 <= idx < len(batch):
                         original = batch[idx]
 
-                        # 날짜 추출
-                        extracted_date = extract_article_date(original["link"]) if original["link"] else None
+                        # 날짜 추출 (미리 분석한 결과가 있으면 사용)
+                        content = None
+                        if original["link"] in analyses:
+                            extracted_date, content = analyses[original["link"]]
+                        else:
+                            extracted_date = extract_article_date(original["link"]) if original["link"] else None
 
                         # 필터링 1: 명확한 날짜
                         if extracted_date is None:
@@ -480,7 +653,8 @@ def validate_news(raw_news_list, today_date):
                             continue
 
                         # 원문 추출
-                        content = get_article_content(original["link"]) if original["link"] else "원문 로드 실패"
+                        if content is None:
+                            content = get_article_content(original["link"]) if original["link"] else "원문 로드 실패"
                         content_length = len(content)
                         content_status = "정상" if content_length >= 100 else ("불완전" if content_length >= 50 else "오류")
 
@@ -505,12 +679,13 @@ def validate_news(raw_news_list, today_date):
                         batch_added += 1
 
             print(f"✅ 배치 {batch_num}: {batch_added}개 추가됨\n")
-            time.sleep(1)  # API 레이트 제한
 
         except Exception as e:
             print(f"⚠️  배치 {batch_num} 오류: {str(e)}\n")
             continue
 
+    if USE_RESPONSE_CACHE:
+        print(f"   ({response_cache.summary()})")
     print(f"✅ 검증 완료: {len(db_records)}개 (당일 명확한 작성일만)\n")
     return db_records
 
@@ -558,7 +733,12 @@ def main():
     print("✓ Step 2: 검증 (AI) + 날짜 필터링")
     print("=" * 80)
 
-    db_records = validate_news(all_news, today_date)
+    parse_pool = start_parse_pool() if PARSE_IN_PROCESSES else None
+    try:
+        db_records = validate_news(all_news, today_date, parse_pool)
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
 
     if not db_records:
         print("❌ 유효한 뉴스 없음 (명확한 당일 작성 뉴스 부재)")
@@ -569,24 +749,31 @@ def main():
     print("🔄 중복 필터링")
     print("=" * 80)
     existing_records = db.get("records", [])
+    existing_copies = db.setdefault("duplicates", [])
     print(f"기존: {len(existing_records)}개")
-    print(f"검증됨: {len(db_records)}개\n")
+    print(f"검증됨: {len(db_records)}개")
+    print(f"유사 기사: {mark_near_duplicates(existing_records, db_records)}개 (duplicates에 대표 기사 링크와 함께 보관)\n")
 
     added_count = 0
+    copy_count = 0
     for record in db_records:
-        if not check_duplicate(record, existing_records):
+        if check_duplicate(record, existing_records) or check_duplicate(record, existing_copies):
+            print(f"⏭️  중복: [{record['news_source']}] {record['title'][:50]}")
+        elif record.get('duplicate_of'):
+            existing_copies.append(record)
+            copy_count += 1
+            print(f"🔗 유사: [{record['news_source']}] {record['title'][:50]}")
+        else:
             db["records"].append(record)
             added_count += 1
             print(f"✅ 추가: [{record['news_source']}] {record['title'][:50]}")
-        else:
-            print(f"⏭️  중복: [{record['news_source']}] {record['title'][:50]}")
 
     db["metadata"]["total_records"] = len(db["records"])
     db["metadata"]["last_updated"] = today_date
 
-    print(f"\n📊 추가 결과: {added_count}개 신규\n")
+    print(f"\n📊 추가 결과: {added_count}개 신규, 유사 기사 {copy_count}개 보관\n")
 
-    if added_count == 0:
+    if added_count + copy_count == 0:
         print("⚠️ 모든 뉴스가 중복. DB 업데이트하지 않습니다.")
         return
 
@@ -599,7 +786,8 @@ def main():
         print(f"📈 수집 통계:")
         print(f"   수집: {len(all_news)}개")
         print(f"   검증: {len(db_records)}개 (당일 명확일)\n   신규: {added_count}개")
-        print(f"   중복: {len(db_records) - added_count}개")
+        print(f"   유사: {copy_count}개 (duplicates)")
+        print(f"   중복: {len(db_records) - added_count - copy_count}개")
         print(f"\n📊 DB 현황:")
         print(f"   총 기사: {len(db['records'])}개")
         print(f"   마지막 업데이트: {db['metadata']['last_updated']}")